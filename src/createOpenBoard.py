@@ -17,7 +17,7 @@ from openboard_common import (
     sanitize_filename, convert_hex_to_rgb, convert_rgb_to_gimp_color,
     find_overlay_files, get_image_orientation, create_guide,
     calculate_overlay_dimensions, place_overlay_in_cell,
-    get_overlay_index_for_cell,
+    get_overlay_index_for_cell, flush_temp_image_pool,
     ENABLE_LOGS, IMAGE_EXTENSIONS, DEFAULT_DPI
 )
 
@@ -654,6 +654,11 @@ def create_board_layout(board_name, dest_folder,
     except Exception as e:
         write_log("Error saving: {0}".format(e))
     
+    # 🧹 Libérer les images temporaires mises en pool (overlays chargés par
+    # place_overlay_in_cell, sondes d'orientation) : sans flush elles
+    # resteraient ouvertes dans GIMP jusqu'à la fin de la session
+    flush_temp_image_pool()
+
     pdb.gimp_display_new(img)
     return img
 
@@ -10,15 +10,17 @@ import math
 import time
 import glob
 import json
+import bisect
 
 # Import du module commun OpenBoard
 from openboard_common import (
-    write_log, safe_float, safe_int,
-    find_overlay_files, get_image_orientation, create_guide,
+    write_log, write_log_debug, safe_float, safe_int,
+    find_overlay_files, get_image_orientation,
+    prefetch_image_orientations, flush_temp_image_pool, create_guide,
     calculate_overlay_dimensions, place_overlay_in_cell,
     get_overlay_index_for_cell,
-    build_layer_bounds_cache, check_cell_occupancy_optimized,
-    find_empty_cell_cached,
+    build_layer_bounds_cache, add_layer_to_cache, reset_group_scan_cache,
+    check_cell_occupancy_optimized, find_empty_cell_cached,
     ENABLE_LOGS, IMAGE_EXTENSIONS, DEFAULT_DPI,
     POSITION_TOLERANCE, MIN_LAYER_SIZE,
     CENTER_TOLERANCE_RATIO, WIDE_IMAGE_THRESHOLD,
@@ -31,6 +33,24 @@ from openboard_common import (
 
 log_file_path = None  # Chemin du fichier log pour cette session
 
+# Dernière direction d'extension par fichier .board pour le mode Alternate.
+# État purement en mémoire : l'ancien fichier extension_direction.txt était
+# écrit, relu puis supprimé en fin d'import, il ne survivait donc jamais à
+# une session de toute façon. L'import le réinitialise dans son finally.
+_last_direction_cache = {}
+
+# Horodatage du dernier gimp_progress_update émis. Chaque update force un
+# repaint de la barre de progression ; au-delà de ~20 images/s les frames
+# intermédiaires ne sont jamais rendues, on les saute donc côté plugin.
+_last_progress_time = [0.0]
+
+def _throttled_progress(frac):
+    """Émettre gimp_progress_update au plus toutes les 50ms (100% passe toujours)."""
+    now = time.time()
+    if now - _last_progress_time[0] >= 0.05 or frac >= 1.0:
+        pdb.gimp_progress_update(frac)
+        _last_progress_time[0] = now
+
 def save_last_cell_index(board_path, cell_index):
     """Save last cell index"""
     try:
@@ -78,47 +98,55 @@ def read_dit_file(dit_path):
     overlay_files = []
     
     try:
+        # Une seule lecture du fichier puis parsing en mémoire : pas de
+        # boucle readline au-dessus du buffer d'E/S
         with open(dit_path, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                
-                if line.startswith('#'):
-                    parts = line[1:].split('=', 1)
-                    if len(parts) == 2:
-                        key = parts[0].strip()
-                        value = parts[1].strip()
-                        
-                        if key == 'overlayFiles':
-                            try:
-                                overlay_files = json.loads(value)
-                                write_log("Found {0} overlay files".format(len(overlay_files)))
-                            except Exception as e:
-                                write_log("ERROR parsing overlayFiles: {0}".format(e))
-                        else:
-                            metadata[key] = value
-                else:
-                    parts = line.split(',')
-                    if len(parts) == 9:
-                        top_left_x = float(parts[1])
-                        top_left_y = float(parts[2])
-                        bottom_right_x = float(parts[5])
-                        bottom_right_y = float(parts[6])
-                        
-                        cell = {
-                            'index': int(parts[0]),
-                            'topLeft': (top_left_x, top_left_y),
-                            'bottomLeft': (float(parts[3]), float(parts[4])),
-                            'bottomRight': (bottom_right_x, bottom_right_y),
-                            'topRight': (float(parts[7]), float(parts[8])),
-                            'minX': top_left_x,
-                            'minY': top_left_y,
-                            'maxX': bottom_right_x,
-                            'maxY': bottom_right_y
-                        }
-                        cells.append(cell)
+            content = f.read()
         
+        for line in content.splitlines():
+            line = line.strip()
+            if not line:
+                continue
+            
+            if line.startswith('#'):
+                parts = line[1:].split('=', 1)
+                if len(parts) == 2:
+                    key = parts[0].strip()
+                    value = parts[1].strip()
+                    
+                    if key == 'overlayFiles':
+                        try:
+                            overlay_files = json.loads(value)
+                            write_log("Found {0} overlay files".format(len(overlay_files)))
+                        except Exception as e:
+                            write_log("ERROR parsing overlayFiles: {0}".format(e))
+                    else:
+                        metadata[key] = value
+            else:
+                parts = line.split(',')
+                if len(parts) == 9:
+                    top_left_x = float(parts[1])
+                    top_left_y = float(parts[2])
+                    bottom_right_x = float(parts[5])
+                    bottom_right_y = float(parts[6])
+                    
+                    cell = {
+                        'index': int(parts[0]),
+                        'topLeft': (top_left_x, top_left_y),
+                        'bottomLeft': (float(parts[3]), float(parts[4])),
+                        'bottomRight': (bottom_right_x, bottom_right_y),
+                        'topRight': (float(parts[7]), float(parts[8])),
+                        # Bornes castées en int dès la lecture : tout le
+                        # code aval (occupation, placement, écriture du
+                        # .board) travaille en pixels entiers, plus aucun
+                        # int() à payer dans les boucles chaudes
+                        'minX': int(top_left_x),
+                        'minY': int(top_left_y),
+                        'maxX': int(bottom_right_x),
+                        'maxY': int(bottom_right_y)
+                    }
+                    cells.append(cell)
+    
         write_log("Successfully read {0} cells".format(len(cells)))
         return {'cells': cells, 'metadata': metadata, 'overlay_files': overlay_files}
     except Exception as e:
@@ -129,101 +157,99 @@ def read_dit_file(dit_path):
 # IMAGE PLACEMENT FUNCTIONS
 # ============================================================================
 
-def load_and_resize_image(image_path, target_width, target_height, resize_mode):
-    """Load and resize image according to mode
-    
+def load_image_as_layer(img, image_path, target_width, target_height, resize_mode):
+    """Load image directly as a layer of img and resize according to mode
+
+    Uses pdb.gimp_file_load_layer (one PDB call) instead of the former
+    gimp_file_load -> gimp_layer_new_from_drawable -> gimp_image_delete
+    round-trip, which allocated and tore down a whole temporary image.
+
     Returns: (layer, final_width, final_height)
     """
     try:
-        loaded_image = pdb.gimp_file_load(image_path, image_path)
-        source_layer = loaded_image.active_layer if loaded_image.active_layer else loaded_image.layers[0]
-        
-        img_width = source_layer.width
-        img_height = source_layer.height
-        
+        new_layer = pdb.gimp_file_load_layer(img, image_path)
+
+        # Dimensions du layer chargé (lecture d'attribut, pas d'appel PDB).
+        # On n'utilise PAS get_image_size() ici : GIMP applique la rotation
+        # EXIF au chargement, donc le header peut annoncer des dimensions
+        # transposées par rapport au layer réellement obtenu.
+        img_width = new_layer.width
+        img_height = new_layer.height
+
         if resize_mode == "noResize":
             final_width = img_width
             final_height = img_height
         else:
             width_ratio = float(target_width) / float(img_width)
             height_ratio = float(target_height) / float(img_height)
-            
+
             if resize_mode == "cover":
                 ratio = max(width_ratio, height_ratio)
             else:  # fit
                 ratio = min(width_ratio, height_ratio)
-            
+
             final_width = int(img_width * ratio)
             final_height = int(img_height * ratio)
-            pdb.gimp_layer_scale(source_layer, final_width, final_height, True)
-        
-        return (loaded_image, source_layer, final_width, final_height)
+            pdb.gimp_layer_scale(new_layer, final_width, final_height, True)
+
+        return (new_layer, final_width, final_height)
     except Exception as e:
         write_log("ERROR loading image: {0}".format(e))
-        return (None, None, 0, 0)
+        return (None, 0, 0)
 
-def calculate_position(cell, cell_type, final_width, final_height, use_side):
+def calculate_position(cell, cell_type, final_width, final_height, use_side, orientation):
     """Calculate target position for image
-    
+
+    orientation is computed once by the caller and threaded through.
+
     Returns: (target_x, target_y)
     """
     cell_left = cell['minX']
     cell_top = cell['minY']
     cell_width = cell['maxX'] - cell['minX']
     cell_height = cell['maxY'] - cell['minY']
-    
-    if cell_type.lower() == "single":
-        target_x = cell_left + (cell_width - final_width) / 2
-        target_y = cell_top + (cell_height - final_height) / 2
-    else:  # spread
-        orientation = "Landscape" if final_width > final_height else "Portrait"
-        if orientation == "Landscape":
-            target_x = cell_left + (cell_width - final_width) / 2
-            target_y = cell_top + (cell_height - final_height) / 2
-        else:  # Portrait
-            half_width = cell_width / 2
-            if use_side == "left":
-                target_x = cell_left + (half_width - final_width) / 2
-            else:
-                target_x = cell_left + half_width + (half_width - final_width) / 2
-            target_y = cell_top + (cell_height - final_height) / 2
-    
+
+    # Sélection arithmétique plutôt qu'un arbre de branches : une image
+    # portrait en spread se centre dans une moitié de cellule, tout le
+    # reste se centre dans la cellule entière.
+    split = (cell_type == "spread" and orientation != "Landscape")
+    span = cell_width / 2 if split else cell_width
+    span_left = cell_left + (span if (split and use_side != "left") else 0)
+
+    target_x = span_left + (span - final_width) / 2
+    target_y = cell_top + (cell_height - final_height) / 2
+
     return (int(target_x), int(target_y))
 
-def create_cell_mask(img, new_layer, cell, cell_type, use_side):
-    """Create mask for image layer"""
+def _calc_mask_rect(cell_left, cell_top, cell_right, cell_bottom, cell_type, use_side, orientation):
+    """Pure arithmetic: compute the mask rectangle for a cell.
+
+    No PDB calls here - keeping the math separated from the GIMP IPC work
+    keeps the hot path cheap and the geometry testable.
+
+    Returns: (mask_left, mask_top, mask_right, mask_bottom)
+    """
+    if cell_type == "single" or orientation == "Landscape":
+        return (cell_left, cell_top, cell_right, cell_bottom)
+
+    # Spread + Portrait: mask covers only one half of the cell
+    half_width = (cell_right - cell_left) / 2
+    if use_side == "left":
+        return (cell_left, cell_top, cell_left + half_width, cell_bottom)
+    else:
+        return (cell_left + half_width, cell_top, cell_right, cell_bottom)
+
+def create_cell_mask(img, new_layer, cell, cell_type, use_side, orientation):
+    """Create mask for image layer
+
+    orientation comes from the caller (computed once per placement),
+    avoiding a PDB round-trip to re-query the layer.
+    """
     try:
-        cell_left = cell['minX']
-        cell_top = cell['minY']
-        cell_right = cell['maxX']
-        cell_bottom = cell['maxY']
-        cell_width = cell_right - cell_left
-        
-        if cell_type.lower() == "single":
-            mask_left = cell_left
-            mask_top = cell_top
-            mask_right = cell_right
-            mask_bottom = cell_bottom
-        else:  # spread
-            layer_width = pdb.gimp_drawable_width(new_layer)
-            orientation = "Landscape" if layer_width > (cell_width * 0.6) else "Portrait"
-            
-            if orientation == "Landscape":
-                mask_left = cell_left
-                mask_top = cell_top
-                mask_right = cell_right
-                mask_bottom = cell_bottom
-            else:  # Portrait
-                half_width = cell_width / 2
-                if use_side == "left":
-                    mask_left = cell_left
-                    mask_right = cell_left + half_width
-                else:
-                    mask_left = cell_left + half_width
-                    mask_right = cell_right
-                mask_top = cell_top
-                mask_bottom = cell_bottom
-        
+        mask_left, mask_top, mask_right, mask_bottom = _calc_mask_rect(
+            cell['minX'], cell['minY'], cell['maxX'], cell['maxY'],
+            cell_type, use_side, orientation)
+
         mask = pdb.gimp_layer_create_mask(new_layer, ADD_ALPHA_MASK)
         pdb.gimp_layer_add_mask(new_layer, mask)
         
@@ -241,59 +267,103 @@ def create_cell_mask(img, new_layer, cell, cell_type, use_side):
         write_log("WARNING: Could not create mask: {0}".format(e))
         return False
 
+# Cache des axes de cellules (positions uniques triées), reconstruit
+# seulement quand la liste de cellules change (extension du board).
+# [liste source, longueur, axes] : la référence forte sur la liste évite
+# qu'un id() recyclé par le GC fasse matcher les axes d'un ancien board
+_cell_axes_cache = [None, -1, None]
+
+# Index nom -> layer des enfants de "Simple page Mask" : évite 2 appels PDB
+# (is_group + get_name) par enfant à chaque placement
+_mask_index_cache = {}
+
+def _get_mask_index(img, group):
+    """Build (once) a {name: layer} dict for the non-group children of group.
+
+    Invalidated when the child count changes (e.g. new masks added by
+    extend_board).
+    """
+    key = (img.ID, group.ID)
+    children = group.children
+    cached = _mask_index_cache.get(key)
+    if cached is not None and cached[0] == len(children):
+        return cached[1]
+
+    index = {}
+    for child in children:
+        if not hasattr(child, 'children'):
+            index[child.name] = child
+
+    _mask_index_cache[key] = (len(children), index)
+    return index
+
+def _get_cell_axes(all_cells):
+    """Get sorted unique minY/minX positions for a cells list, memoized.
+
+    Returns: (unique_y_positions, unique_x_positions)
+    """
+    if _cell_axes_cache[0] is all_cells and \
+       _cell_axes_cache[1] == len(all_cells):
+        return _cell_axes_cache[2]
+
+    unique_y_positions = sorted(set(c['minY'] for c in all_cells))
+    unique_x_positions = sorted(set(c['minX'] for c in all_cells))
+
+    axes = (unique_y_positions, unique_x_positions)
+    _cell_axes_cache[0] = all_cells
+    _cell_axes_cache[1] = len(all_cells)
+    _cell_axes_cache[2] = axes
+    return axes
+
+def _find_axis_index(positions, value):
+    """Find 1-based index of value in a sorted positions list, with tolerance.
+
+    One bisect binary search handles both the exact match and the
+    POSITION_TOLERANCE fallback - no float-keyed dict, no linear scan.
+    Returns None if no position is within tolerance.
+    """
+    i = bisect.bisect_left(positions, value)
+    for j in (i - 1, i):
+        if 0 <= j < len(positions) and abs(positions[j] - value) < POSITION_TOLERANCE:
+            return j + 1
+    return None
+
 def update_simple_page_mask(img, cell, cell_type, all_cells, board_metadata, orientation):
     """Update Simple page Mask visibility"""
-    if cell_type.lower() != "spread":
+    if cell_type != "spread":
         return
     
     try:
         board_elements_group = None
         for layer in img.layers:
-            if pdb.gimp_item_is_group(layer) and pdb.gimp_item_get_name(layer) == "Board Elements":
+            if hasattr(layer, 'children') and layer.name == "Board Elements":
                 board_elements_group = layer
                 break
         
         if not board_elements_group:
             return
         
-        if not pdb.gimp_item_get_visible(board_elements_group):
-            pdb.gimp_item_set_visible(board_elements_group, True)
+        # set_visible sur une valeur identique est un no-op côté GIMP :
+        # inutile de payer un get_visible de plus pour le vérifier
+        pdb.gimp_item_set_visible(board_elements_group, True)
         
         simple_page_group = None
         for child in board_elements_group.children:
-            if pdb.gimp_item_is_group(child) and pdb.gimp_item_get_name(child) == "Simple page Mask":
+            if hasattr(child, 'children') and child.name == "Simple page Mask":
                 simple_page_group = child
                 break
         
         if not simple_page_group:
             return
         
-        if not pdb.gimp_item_get_visible(simple_page_group):
-            pdb.gimp_item_set_visible(simple_page_group, True)
-        
-        # Calculate row/col from position
-        unique_y_positions = sorted(set(c['minY'] for c in all_cells))
-        unique_x_positions = sorted(set(c['minX'] for c in all_cells))
+        pdb.gimp_item_set_visible(simple_page_group, True)
         
-        y_to_row = {y: idx + 1 for idx, y in enumerate(unique_y_positions)}
-        x_to_col = {x: idx + 1 for idx, x in enumerate(unique_x_positions)}
-        
-        current_y = cell['minY']
-        current_x = cell['minX']
-        
-        row = y_to_row.get(current_y)
-        col = x_to_col.get(current_x)
-        
-        if row is None or col is None:
-            # Fallback with tolerance
-            for y_pos in unique_y_positions:
-                if abs(y_pos - current_y) < POSITION_TOLERANCE:
-                    row = y_to_row[y_pos]
-                    break
-            for x_pos in unique_x_positions:
-                if abs(x_pos - current_x) < POSITION_TOLERANCE:
-                    col = x_to_col[x_pos]
-                    break
+        # Calculate row/col from position (axes memoized across placements,
+        # binary search handles exact and tolerant matches alike)
+        unique_y_positions, unique_x_positions = _get_cell_axes(all_cells)
+
+        row = _find_axis_index(unique_y_positions, cell['minY'])
+        col = _find_axis_index(unique_x_positions, cell['minX'])
         
         if row is None or col is None:
             # Final fallback
@@ -303,36 +373,58 @@ def update_simple_page_mask(img, cell, cell_type, all_cells, board_metadata, ori
             col = ((cell_index - 1) % nbr_cols) + 1
         
         mask_id = "R{0}C{1}".format(row, col)
-        write_log("Looking for mask: {0}".format(mask_id))
-        
-        for child in simple_page_group.children:
-            if not pdb.gimp_item_is_group(child) and pdb.gimp_item_get_name(child) == mask_id:
-                should_enable = (orientation == "Portrait")
-                pdb.gimp_item_set_visible(child, should_enable)
-                write_log("Mask {0} visibility: {1}".format(mask_id, should_enable))
-                break
+        write_log("Looking for mask: {0}", None, mask_id)
+
+        child = _get_mask_index(img, simple_page_group).get(mask_id)
+        if child is not None:
+            # "Square" compte comme Portrait (placement en demi-cellule) :
+            # même règle que calculate_position / _calc_mask_rect, le
+            # séparateur doit donc être visible aussi pour une image carrée
+            should_enable = (orientation != "Landscape")
+            pdb.gimp_item_set_visible(child, should_enable)
+            write_log("Mask {0} visibility: {1}", None, mask_id, should_enable)
     except Exception as e:
         write_log("WARNING: Could not update mask: {0}".format(e))
 
-def place_image_in_cell(img, image_path, cell, cell_type, resize_mode, board_metadata, all_cells, use_side="left", should_create_guides=False):
-    """Place image in cell - main function"""
-    write_log("====== Placing image in cell {0} ======".format(cell['index']))
-    write_log("Image: {0}".format(image_path))
-    
+def place_image_in_cell(img, image_path, cell, cell_type, resize_mode, board_metadata, all_cells, use_side="left", should_create_guides=False, layer_name=None, orientation=None):
+    """Place image in cell - main function
+
+    layer_name and orientation can be precomputed by the caller (batch
+    imports already derive both per file); each falls back to being
+    computed from image_path.
+
+    Returns the placed layer on success (truthy), None on failure, so the
+    caller can update the bounds cache incrementally.
+    """
+    write_log("====== Placing image in cell {0} ======", None, cell['index'])
+    write_log("Image: {0}", None, image_path)
+
+    # Normaliser une seule fois ; les helpers internes comparent ensuite
+    # directement sans .lower() répétés
+    cell_type = cell_type.lower()
+
+    undo_started = False
     try:
+        # Group the whole placement so it is a single undoable transaction
+        pdb.gimp_image_undo_group_start(img)
+        undo_started = True
+
         cell_width = int(cell['maxX'] - cell['minX'])
         cell_height = int(cell['maxY'] - cell['minY'])
         cell_left = int(cell['minX'])
         cell_top = int(cell['minY'])
         
         margin_size = safe_float(board_metadata.get('adjustedMargin', 0))
-        
+
+        # Orientation computed once (header read) and threaded through
+        if orientation is None:
+            orientation = get_image_orientation(image_path)
+
         # Determine target dimensions
-        if cell_type.lower() == "single":
+        if cell_type == "single":
             target_width = cell_width - (2 * margin_size)
             target_height = cell_height - (2 * margin_size)
         else:  # spread
-            orientation = get_image_orientation(image_path)
             if orientation == "Landscape":
                 target_width = cell_width - (2 * margin_size)
                 target_height = cell_height - (2 * margin_size)
@@ -340,52 +432,64 @@ def place_image_in_cell(img, image_path, cell, cell_type, resize_mode, board_met
                 target_width = (cell_width / 2) - (2 * margin_size)
                 target_height = cell_height - (2 * margin_size)
         
-        # Load and resize
-        loaded_image, source_layer, final_width, final_height = load_and_resize_image(
-            image_path, target_width, target_height, resize_mode)
-        
-        if not loaded_image:
-            return False
-        
-        # Copy to destination
-        new_layer = pdb.gimp_layer_new_from_drawable(source_layer, img)
-        pdb.gimp_image_insert_layer(img, new_layer, None, 0)
-        
-        layer_name = os.path.splitext(os.path.basename(image_path))[0]
+        # Load directly as a layer of the destination image
+        new_layer, final_width, final_height = load_image_as_layer(
+            img, image_path, target_width, target_height, resize_mode)
+
+        if not new_layer:
+            return None
+
+        # Nommer et positionner AVANT l'insertion : le layer apparaît déjà
+        # en place, sans invalidations d'affichage intermédiaires
+        if layer_name is None:
+            layer_name = os.path.splitext(os.path.basename(image_path))[0]
         pdb.gimp_item_set_name(new_layer, layer_name)
-        
-        # Calculate and set position
-        target_x, target_y = calculate_position(cell, cell_type, final_width, final_height, use_side)
+
+        target_x, target_y = calculate_position(cell, cell_type, final_width, final_height, use_side, orientation)
         pdb.gimp_layer_set_offsets(new_layer, target_x, target_y)
-        
+
+        pdb.gimp_image_insert_layer(img, new_layer, None, 0)
+
         # Create mask
-        create_cell_mask(img, new_layer, cell, cell_type, use_side)
-        
+        create_cell_mask(img, new_layer, cell, cell_type, use_side, orientation)
+
         # Update simple page mask
-        orientation = "Landscape" if final_width > final_height else "Portrait"
         update_simple_page_mask(img, cell, cell_type, all_cells, board_metadata, orientation)
         
         # Create guides if requested
         if should_create_guides:
             try:
                 write_log("Creating guides for cell")
-                # Cell borders
-                create_guide(img, cell_left, "vertical")
-                create_guide(img, cell_left + cell_width, "vertical")
-                create_guide(img, cell_top, "horizontal")
-                create_guide(img, cell_top + cell_height, "horizontal")
-                
+                # Precompute all (position, orientation) pairs, then create
+                # them inside one undo group (single undo entry instead of
+                # up to 9 separate ones)
+                guides = [
+                    (cell_left, "vertical"),
+                    (cell_left + cell_width, "vertical"),
+                    (cell_top, "horizontal"),
+                    (cell_top + cell_height, "horizontal")
+                ]
+
                 # Margins
                 if margin_size > 0:
-                    create_guide(img, int(cell_left + margin_size), "vertical")
-                    create_guide(img, int(cell_left + cell_width - margin_size), "vertical")
-                    create_guide(img, int(cell_top + margin_size), "horizontal")
-                    create_guide(img, int(cell_top + cell_height - margin_size), "horizontal")
-                
+                    guides.extend([
+                        (int(cell_left + margin_size), "vertical"),
+                        (int(cell_left + cell_width - margin_size), "vertical"),
+                        (int(cell_top + margin_size), "horizontal"),
+                        (int(cell_top + cell_height - margin_size), "horizontal")
+                    ])
+
                 # Center guide for spread cells
-                if cell_type.lower() == "spread":
-                    create_guide(img, int(cell_left + cell_width / 2), "vertical")
-                
+                if cell_type == "spread":
+                    guides.append((int(cell_left + cell_width / 2), "vertical"))
+
+                pdb.gimp_image_undo_group_start(img)
+                try:
+                    for guide_position, guide_orientation in guides:
+                        create_guide(img, guide_position, guide_orientation)
+                finally:
+                    pdb.gimp_image_undo_group_end(img)
+
                 write_log("Guides created successfully")
             except Exception as guide_error:
                 write_log("WARNING: Could not create guides: {0}".format(guide_error))
@@ -393,23 +497,27 @@ def place_image_in_cell(img, image_path, cell, cell_type, resize_mode, board_met
         # Move to Board Content group
         board_content_group = None
         for layer in img.layers:
-            if pdb.gimp_item_is_group(layer) and pdb.gimp_item_get_name(layer) == "Board Content":
+            if hasattr(layer, 'children') and layer.name == "Board Content":
                 board_content_group = layer
                 break
         
         if board_content_group:
             pdb.gimp_image_reorder_item(img, new_layer, board_content_group, 0)
-        
-        pdb.gimp_image_delete(loaded_image)
-        
+
         write_log("====== Image placed successfully ======")
-        return True
+        return new_layer
         
     except Exception as e:
         write_log("ERROR placing image: {0}".format(e))
         import traceback
         write_log("Traceback: {0}".format(traceback.format_exc()))
-        return False
+        return None
+    finally:
+        if undo_started:
+            try:
+                pdb.gimp_image_undo_group_end(img)
+            except:
+                pass
 
 # ============================================================================
 # CELL OCCUPANCY DETECTION - Utilise le cache de openboard_common
@@ -423,8 +531,51 @@ def place_image_in_cell(img, image_path, cell, cell_type, resize_mode, board_met
 # BOARD EXTENSION
 # ============================================================================
 
+def _index_layers(img):
+    """Index the board structure layers by name in a single traversal
+
+    Une passe sur img.layers plus une descente dans "Board Elements"
+    remplace les parcours répétés (bloc de découverte, recherche de la
+    Legend) qui interrogeaient chaque calque via le PDB. Accès attributs
+    uniquement : aucun aller-retour PDB.
+    """
+    index = {}
+    for layer in img.layers:
+        name = layer.name
+        is_group = hasattr(layer, 'children')
+        if name == "Background":
+            index['Background'] = layer
+        elif is_group and name == "Board Elements":
+            index['Board Elements'] = layer
+            for child in layer.children:
+                child_name = child.name
+                if child_name in ("Mask", "Borders", "Gutters", "Legend",
+                                  "Simple page Mask", "Overlay"):
+                    index[child_name] = child
+        elif not is_group and name == "Legend":
+            # Fallback : une Legend enfant de Board Elements est prioritaire
+            index.setdefault('Legend', layer)
+    return index
+
+def _select_rects(img, rects):
+    """Select the union of several rectangles in a single selection
+
+    One CHANNEL_OP_REPLACE for the first rect, then CHANNEL_OP_ADD for the
+    rest: the caller pays one edit operation for N rects instead of N
+    select/edit/deselect cycles.
+    """
+    op = CHANNEL_OP_REPLACE
+    for x, y, w, h in rects:
+        pdb.gimp_image_select_rectangle(img, op, x, y, w, h)
+        op = CHANNEL_OP_ADD
+
 def extend_board(img, dit_path, cells, metadata, extension_direction, cell_type, overlay_files=None):
-    """Extend board by adding row or column"""
+    """Extend board by adding row or column
+
+    Returns the updated board data ({'cells', 'metadata', 'overlay_files'},
+    same shape as read_dit_file) on success, None on failure.
+    """
+    undo_started = False
     try:
         write_log("====== Extending board ======")
         write_log("Current cells: {0}".format(len(cells)))
@@ -433,15 +584,19 @@ def extend_board(img, dit_path, cells, metadata, extension_direction, cell_type,
         nbr_cols = int(metadata.get('nbrCols', 3))
         nbr_rows = int(metadata.get('nbrRows', 4))
         
-        # Calculate spacing from existing cells
+        # Calculate spacing from existing cells : regroupement par rangée
+        # (minY arrondi à la tolérance) au lieu d'un tri global — seuls
+        # deux voisins d'une même rangée sont nécessaires
         layout_spacing = 40.0
         if len(cells) >= 2:
-            cells_sorted = sorted(cells, key=lambda c: (c['minY'], c['minX']))
-            for i in range(len(cells_sorted) - 1):
-                cell1 = cells_sorted[i]
-                cell2 = cells_sorted[i + 1]
-                if abs(cell1['minY'] - cell2['minY']) < POSITION_TOLERANCE:
-                    spacing_x = cell2['minX'] - cell1['maxX']
+            by_row = {}
+            for c in cells:
+                key = int(round(c['minY'] / POSITION_TOLERANCE))
+                by_row.setdefault(key, []).append(c)
+            for row in by_row.values():
+                if len(row) >= 2:
+                    row.sort(key=lambda c: c['minX'])
+                    spacing_x = row[1]['minX'] - row[0]['maxX']
                     if spacing_x > 0:
                         layout_spacing = spacing_x
                         break
@@ -453,19 +608,9 @@ def extend_board(img, dit_path, cells, metadata, extension_direction, cell_type,
         
         # Determine effective direction
         effective_direction = extension_direction
-        alternate_pref_file = None
         
         if extension_direction == 2:  # Alternate
-            board_dir = os.path.dirname(dit_path)
-            alternate_pref_file = os.path.join(board_dir, "extension_direction.txt")
-            
-            last_direction = None
-            if os.path.exists(alternate_pref_file):
-                try:
-                    with open(alternate_pref_file, 'r') as f:
-                        last_direction = f.read().strip()
-                except:
-                    pass
+            last_direction = _last_direction_cache.get(dit_path)
             
             if last_direction == "Right":
                 effective_direction = 0  # Bottom
@@ -474,62 +619,80 @@ def extend_board(img, dit_path, cells, metadata, extension_direction, cell_type,
             
             write_log("Alternate mode: using {0}".format(["Bottom", "Right"][effective_direction]))
         
-        # Calculate dimensions
-        max_x = max(cell['maxX'] for cell in cells)
-        max_y = max(cell['maxY'] for cell in cells)
+        # Calculate dimensions - une seule passe sur les cellules pour les
+        # maxima et les positions uniques de rangées/colonnes
+        max_x = max_y = float('-inf')
+        ys = set()
+        xs = set()
+        for c in cells:
+            mx = c['maxX']
+            my = c['maxY']
+            if mx > max_x:
+                max_x = mx
+            if my > max_y:
+                max_y = my
+            ys.add(c['minY'])
+            xs.add(c['minX'])
         cell_width = cells[0]['maxX'] - cells[0]['minX']
         cell_height = cells[0]['maxY'] - cells[0]['minY']
         
-        new_cells = []
         old_width = pdb.gimp_image_width(img)
         old_height = pdb.gimp_image_height(img)
         
+        # Les coordonnées invariantes de la rangée/colonne ajoutée sont
+        # calculées une fois hors boucle ; chaque enregistrement ne fait
+        # plus que deux additions
+        base_index = len(cells)
         if effective_direction == 1:  # Right
             new_col_x = max_x + layout_spacing
-            row_positions = sorted(set(cell['minY'] for cell in cells))
+            new_col_right = new_col_x + cell_width
+            new_col = nbr_cols + 1
+            row_positions = sorted(ys)
+            new_cells = [None] * len(row_positions)
             
             for i, row_y in enumerate(row_positions):
-                cell_row = i + 1
-                cell_col = nbr_cols + 1
+                row_bottom = row_y + cell_height
                 new_cell = {
-                    'index': len(cells) + i + 1,
+                    'index': base_index + i + 1,
                     'topLeft': (new_col_x, row_y),
-                    'bottomLeft': (new_col_x, row_y + cell_height),
-                    'bottomRight': (new_col_x + cell_width, row_y + cell_height),
-                    'topRight': (new_col_x + cell_width, row_y),
+                    'bottomLeft': (new_col_x, row_bottom),
+                    'bottomRight': (new_col_right, row_bottom),
+                    'topRight': (new_col_right, row_y),
                     'minX': new_col_x,
-                    'maxX': new_col_x + cell_width,
+                    'maxX': new_col_right,
                     'minY': row_y,
-                    'maxY': row_y + cell_height,
-                    'row': cell_row,
-                    'col': cell_col
+                    'maxY': row_bottom,
+                    'row': i + 1,
+                    'col': new_col
                 }
-                new_cells.append(new_cell)
+                new_cells[i] = new_cell
             
             new_width = int(old_width + cell_width + layout_spacing)
             new_height = old_height
             nbr_cols += 1
         else:  # Bottom
             new_row_y = max_y + layout_spacing
-            col_positions = sorted(set(cell['minX'] for cell in cells))
+            new_row_bottom = new_row_y + cell_height
+            new_row = nbr_rows + 1
+            col_positions = sorted(xs)
+            new_cells = [None] * len(col_positions)
             
             for i, col_x in enumerate(col_positions):
-                cell_row = nbr_rows + 1
-                cell_col = i + 1
+                col_right = col_x + cell_width
                 new_cell = {
-                    'index': len(cells) + i + 1,
+                    'index': base_index + i + 1,
                     'topLeft': (col_x, new_row_y),
-                    'bottomLeft': (col_x, new_row_y + cell_height),
-                    'bottomRight': (col_x + cell_width, new_row_y + cell_height),
-                    'topRight': (col_x + cell_width, new_row_y),
+                    'bottomLeft': (col_x, new_row_bottom),
+                    'bottomRight': (col_right, new_row_bottom),
+                    'topRight': (col_right, new_row_y),
                     'minX': col_x,
-                    'maxX': col_x + cell_width,
+                    'maxX': col_right,
                     'minY': new_row_y,
-                    'maxY': new_row_y + cell_height,
-                    'row': cell_row,
-                    'col': cell_col
+                    'maxY': new_row_bottom,
+                    'row': new_row,
+                    'col': i + 1
                 }
-                new_cells.append(new_cell)
+                new_cells[i] = new_cell
             
             new_width = old_width
             new_height = int(old_height + cell_height + layout_spacing)
@@ -537,74 +700,47 @@ def extend_board(img, dit_path, cells, metadata, extension_direction, cell_type,
         
         write_log("New dimensions: {0}x{1}".format(new_width, new_height))
         
+        # Toutes les mutations qui suivent forment une seule étape d'undo :
+        # sans le groupe, chaque resize/fill/clear empile sa propre entrée
+        pdb.gimp_image_undo_group_start(img)
+        undo_started = True
+
         # Resize canvas
         pdb.gimp_image_resize(img, new_width, new_height, 0, 0)
         
-        # Find existing layers to update
+        # Find existing layers to update (single traversal, indexed by name)
         write_log("Finding existing layers to update...")
-        board_elements_group = None
-        mask_layer = None
-        borders_layer = None
-        gutters_layer = None
-        simple_page_group = None
-        background_layer = None
-        overlay_group = None
-        structure_layers_to_resize = []
-        
-        # Find Board Elements group and its sub-layers + Background
-        for layer in img.layers:
-            layer_name = pdb.gimp_item_get_name(layer)
-            
-            # Find Background layer
-            if layer_name == "Background":
-                background_layer = layer
-                structure_layers_to_resize.append(layer)
-                write_log("Found Background layer")
-            
-            # Find Board Elements group
-            if pdb.gimp_item_is_group(layer):
-                if layer_name == "Board Elements":
-                    board_elements_group = layer
-                    write_log("Found Board Elements group")
-                    
-                    # Find sub-layers
-                    for child in layer.children:
-                        child_name = pdb.gimp_item_get_name(child)
-                        if child_name == "Mask":
-                            mask_layer = child
-                            structure_layers_to_resize.append(child)
-                            write_log("Found Mask layer")
-                        elif child_name == "Borders":
-                            borders_layer = child
-                            structure_layers_to_resize.append(child)
-                            write_log("Found Borders layer")
-                        elif child_name == "Gutters":
-                            gutters_layer = child
-                            structure_layers_to_resize.append(child)
-                            write_log("Found Gutters layer")
-                        elif pdb.gimp_item_is_group(child) and child_name == "Simple page Mask":
-                            simple_page_group = child
-                            write_log("Found Simple page Mask group")
-                            # Add all individual masks
-                            for mask_child in child.children:
-                                if not pdb.gimp_item_is_group(mask_child):
-                                    structure_layers_to_resize.append(mask_child)
-                        elif pdb.gimp_item_is_group(child) and child_name == "Overlay":
-                            overlay_group = child
-                            write_log("Found Overlay group")
+        layer_index = _index_layers(img)
+        background_layer = layer_index.get('Background')
+        board_elements_group = layer_index.get('Board Elements')
+        mask_layer = layer_index.get('Mask')
+        borders_layer = layer_index.get('Borders')
+        gutters_layer = layer_index.get('Gutters')
+        simple_page_group = layer_index.get('Simple page Mask')
+        overlay_group = layer_index.get('Overlay')
+        
+        structure_layers_to_resize = [l for l in (background_layer, mask_layer,
+                                                  borders_layer, gutters_layer)
+                                      if l is not None]
+        if simple_page_group:
+            # Add all individual masks
+            for mask_child in simple_page_group.children:
+                if not hasattr(mask_child, 'children'):
+                    structure_layers_to_resize.append(mask_child)
         
         # Resize ONLY structure layers
         write_log("Resizing {0} structure layers...".format(len(structure_layers_to_resize)))
         for layer in structure_layers_to_resize:
             try:
-                layer_name = pdb.gimp_item_get_name(layer)
-                old_layer_width = pdb.gimp_drawable_width(layer)
-                old_layer_height = pdb.gimp_drawable_height(layer)
+                # Dimensions lues via les attributs du binding : le test de
+                # skip ne coûte aucun aller-retour PDB
+                old_layer_width = layer.width
+                old_layer_height = layer.height
                 
                 if old_layer_width != new_width or old_layer_height != new_height:
                     pdb.gimp_layer_resize(layer, new_width, new_height, 0, 0)
-                    write_log("Resized '{0}' from {1}x{2} to {3}x{4}".format(
-                        layer_name, old_layer_width, old_layer_height, new_width, new_height))
+                    write_log_debug("Resized '{0}' from {1}x{2} to {3}x{4}".format(
+                        layer.name, old_layer_width, old_layer_height, new_width, new_height))
             except Exception as e:
                 write_log("WARNING: Could not resize layer: {0}".format(e))
         
@@ -613,7 +749,14 @@ def extend_board(img, dit_path, cells, metadata, extension_direction, cell_type,
         write_log("Using margin: {0}px".format(margin_size))
         
         # FILL newly created canvas areas
+        # Undo gelé pendant les remplissages de zone : pas d'allocation de
+        # tampons d'undo pour des pixels qui viennent d'être créés
         write_log("Filling newly created canvas areas...")
+        pdb.gimp_image_undo_freeze(img)
+        # Contexte de peinture poussé une fois pour les trois remplissages :
+        # les set_foreground restent locaux au lieu d'écraser le contexte
+        # global de l'utilisateur
+        pdb.gimp_context_push()
         
         if effective_direction == 1:  # Right
             new_area_x = old_width
@@ -638,7 +781,7 @@ def extend_board(img, dit_path, cells, metadata, extension_direction, cell_type,
                 pdb.gimp_context_set_foreground((0, 0, 0))
                 pdb.gimp_edit_fill(mask_layer, FILL_FOREGROUND)
                 pdb.gimp_selection_none(img)
-                write_log("Mask layer filled")
+                write_log_debug("Mask layer filled")
             except Exception as e:
                 write_log("WARNING: Could not fill Mask: {0}".format(e))
         
@@ -651,61 +794,114 @@ def extend_board(img, dit_path, cells, metadata, extension_direction, cell_type,
                 pdb.gimp_context_set_foreground((200, 200, 200))
                 pdb.gimp_edit_fill(borders_layer, FILL_FOREGROUND)
                 pdb.gimp_selection_none(img)
-                write_log("Borders layer filled")
+                write_log_debug("Borders layer filled")
             except Exception as e:
                 write_log("WARNING: Could not fill Borders: {0}".format(e))
         
-        # Fill Background layer with white
+        # Fill Background layer with white (FILL_WHITE ne lit pas le
+        # foreground : un set_foreground de moins)
         if background_layer and new_area_width > 0 and new_area_height > 0:
             try:
                 pdb.gimp_image_select_rectangle(img, CHANNEL_OP_REPLACE,
                                                int(new_area_x), int(new_area_y),
                                                int(new_area_width), int(new_area_height))
-                pdb.gimp_context_set_foreground((255, 255, 255))
-                pdb.gimp_edit_fill(background_layer, FILL_FOREGROUND)
+                pdb.gimp_edit_fill(background_layer, FILL_WHITE)
                 pdb.gimp_selection_none(img)
-                write_log("Background layer filled")
+                write_log_debug("Background layer filled")
             except Exception as e:
                 write_log("WARNING: Could not fill Background: {0}".format(e))
         
+        pdb.gimp_context_pop()
+        pdb.gimp_image_undo_thaw(img)
+        
         # UPDATE LAYERS for each new cell
+        # Les trous du Mask et des Borders sont accumulés puis dégagés en
+        # une seule sélection multi-rectangles après la boucle
+        # Invariants de la boucle : toutes les nouvelles cellules partagent
+        # les mêmes dimensions, seules leurs origines changent
+        cw = int(cell_width)
+        ch = int(cell_height)
+        m = int(margin_size)
+        two_m = 2 * m
+        inner_w = cw - two_m
+        inner_h = ch - two_m
+        half_cw = cw // 2
+        gutter_width = max(2, int(round(cw / 500.0)))
+        gutter_height = int(ch * 0.9)
+        gutter_y_offset = (ch - gutter_height) // 2
+        gutter_x_offset = half_cw - gutter_width // 2
+        
+        # Les nouvelles cellules partagent leurs dimensions : les infos de
+        # placement d'overlay sont précalculées par index de fichier, la
+        # boucle se contente d'une lecture de table
+        position_table = []
+        if overlay_group and overlay_files:
+            overlay_dims_cache = {}
+            for overlay_file in overlay_files:
+                orient = get_image_orientation(overlay_file)
+                info = overlay_dims_cache.get(orient)
+                if info is None:
+                    info = calculate_overlay_dimensions(
+                        cw, ch, cell_type, orient, margin_size
+                    )
+                    overlay_dims_cache[orient] = info
+                position_table.append(info)
+        
+        # Programme d'overlays précalculé : tout le travail hors PDB (choix
+        # du fichier, fallback row/col, infos de placement, fichier droit en
+        # mode split) est fait ici, la boucle ne fait plus que les appels GIMP
+        overlay_schedule = {}
+        if position_table:
+            nbr_overlays = len(overlay_files)
+            for nc in new_cells:
+                o_row = nc.get('row')
+                o_col = nc.get('col')
+                if o_row is None or o_col is None:
+                    cell_index = nc['index']
+                    o_row = ((cell_index - 1) // nbr_cols) + 1
+                    o_col = ((cell_index - 1) % nbr_cols) + 1
+                overlay_index = get_overlay_index_for_cell(
+                    o_row, o_col, nbr_cols, nbr_overlays, cell_type) % nbr_overlays
+                position_info = position_table[overlay_index]
+                if position_info['position'] == 'split' and nbr_overlays > 1:
+                    right_path = overlay_files[(overlay_index + 1) % nbr_overlays]
+                else:
+                    # Un seul overlay : le même fichier sert aux deux côtés
+                    right_path = overlay_files[overlay_index]
+                overlay_schedule[nc['index']] = (
+                    overlay_files[overlay_index], position_info, right_path,
+                    o_row, o_col)
+        
+        is_spread = (cell_type.lower() == "spread")
+        
+        # Contexte poussé une fois pour toute la boucle : la couleur des
+        # masques de page simple est réglée une seule fois ici, celle des
+        # gouttières une seule fois après la boucle
+        pdb.gimp_context_push()
+        if is_spread and simple_page_group:
+            pdb.gimp_context_set_foreground(border_color)
+        
+        mask_rects = []
+        border_rects = []
+        gutter_rects = []
         for new_cell in new_cells:
             cell_lx = int(new_cell['minX'])
-            cell_rx = int(new_cell['maxX'])
             cell_ty = int(new_cell['minY'])
-            cell_by = int(new_cell['maxY'])
-            cell_width_calc = cell_rx - cell_lx
-            cell_height_calc = cell_by - cell_ty
             
-            write_log("Updating layers for cell {0}".format(new_cell['index']))
+            write_log_debug("Updating layers for cell {0}".format(new_cell['index']))
             
             # 1. Update Mask layer - Create hole for cell
             if mask_layer:
-                try:
-                    pdb.gimp_image_select_rectangle(img, CHANNEL_OP_REPLACE, 
-                                                   cell_lx, cell_ty, cell_width_calc, cell_height_calc)
-                    pdb.gimp_edit_clear(mask_layer)
-                    pdb.gimp_selection_none(img)
-                except Exception as e:
-                    write_log("WARNING: Could not update Mask: {0}".format(e))
+                mask_rects.append((cell_lx, cell_ty, cw, ch))
             
             # 2. Update Borders layer - Create hole with margins
+            # (à marge nulle le rectangle intérieur serait identique au trou
+            # du Mask déjà dégagé : aucun second cycle de sélection à payer)
             if borders_layer and margin_size > 0:
-                try:
-                    inner_x = cell_lx + int(margin_size)
-                    inner_y = cell_ty + int(margin_size)
-                    inner_width = cell_width_calc - int(2 * margin_size)
-                    inner_height = cell_height_calc - int(2 * margin_size)
-                    
-                    pdb.gimp_image_select_rectangle(img, CHANNEL_OP_REPLACE,
-                                                   inner_x, inner_y, inner_width, inner_height)
-                    pdb.gimp_edit_clear(borders_layer)
-                    pdb.gimp_selection_none(img)
-                except Exception as e:
-                    write_log("WARNING: Could not update Borders: {0}".format(e))
+                border_rects.append((cell_lx + m, cell_ty + m, inner_w, inner_h))
             
             # 3. Create Simple page Mask for new cell (spread mode only)
-            if cell_type.lower() == "spread" and simple_page_group:
+            if is_spread and simple_page_group:
                 try:
                     row = new_cell.get('row')
                     col = new_cell.get('col')
@@ -717,88 +913,47 @@ def extend_board(img, dit_path, cells, metadata, extension_direction, cell_type,
                     
                     mask_name = "R{0}C{1}".format(row, col)
                     
-                    # Create mask layer using GIMP Python API style
-                    mask_layer_spm = pdb.gimp_layer_new(img, new_width, new_height,
+                    # Calque réduit au rectangle central et positionné par
+                    # offsets : pas de tampon RGBA pleine toile par cellule,
+                    # et drawable_fill remplace le trio select/fill/deselect
+                    rect_x = cell_lx + half_cw - m
+                    rect_y = cell_ty
+                    
+                    mask_layer_spm = pdb.gimp_layer_new(img, two_m, ch,
                                                         RGBA_IMAGE, mask_name, 100, NORMAL_MODE)
                     pdb.gimp_image_insert_layer(img, mask_layer_spm, simple_page_group, 0)
+                    pdb.gimp_layer_set_offsets(mask_layer_spm, rect_x, rect_y)
                     
-                    # Fill mask with rectangle at center
-                    middle_x = cell_lx + (cell_width_calc / 2)
-                    rect_x = int(middle_x - margin_size)
-                    rect_y = cell_ty
-                    rect_width = int(2 * margin_size)
-                    rect_height = cell_height_calc
-                    
-                    pdb.gimp_image_select_rectangle(img, CHANNEL_OP_REPLACE,
-                                                   rect_x, rect_y, rect_width, rect_height)
-                    pdb.gimp_context_set_foreground(border_color)
-                    pdb.gimp_edit_fill(mask_layer_spm, FILL_FOREGROUND)
-                    pdb.gimp_selection_none(img)
+                    pdb.gimp_drawable_fill(mask_layer_spm, FILL_FOREGROUND)
                     
                     pdb.gimp_item_set_visible(mask_layer_spm, False)
-                    write_log("Simple page mask {0} created".format(mask_name))
+                    write_log_debug("Simple page mask {0} created".format(mask_name))
                 except Exception as e:
                     write_log("WARNING: Could not create Simple page mask: {0}".format(e))
             
-            # 4. Create gutter for new cell (spread mode only)
-            if cell_type.lower() == "spread" and gutters_layer:
-                try:
-                    middle_x = cell_lx + (cell_width_calc / 2)
-                    gutter_width = max(2, int(round(cell_width_calc / 500.0)))
-                    gutter_height = int(cell_height_calc * 0.9)
-                    gutter_y_offset = int((cell_height_calc - gutter_height) / 2)
-                    
-                    gutter_x = int(middle_x - gutter_width / 2)
-                    gutter_y = cell_ty + gutter_y_offset
-                    
-                    pdb.gimp_image_select_rectangle(img, CHANNEL_OP_REPLACE,
-                                                   gutter_x, gutter_y, gutter_width, gutter_height)
-                    pdb.gimp_context_set_foreground((34, 34, 34))
-                    pdb.gimp_edit_fill(gutters_layer, FILL_FOREGROUND)
-                    pdb.gimp_selection_none(img)
-                    write_log("Gutter created")
-                except Exception as e:
-                    write_log("WARNING: Could not create gutter: {0}".format(e))
+            # 4. Create gutter for new cell (spread mode only) - rectangles
+            # accumulés puis remplis en une passe après la boucle
+            if is_spread and gutters_layer:
+                gutter_rects.append((cell_lx + gutter_x_offset,
+                                     cell_ty + gutter_y_offset,
+                                     gutter_width, gutter_height))
             
             # 5. Place overlay for new cell (if overlays are enabled)
-            # Logique identique a la V1 (importGimpBoard.py lignes 1589-1660)
-            if overlay_group and overlay_files and len(overlay_files) > 0:
+            # Logique identique a la V1 (importGimpBoard.py lignes 1589-1660),
+            # mais pilotée par le programme précalculé
+            if overlay_schedule:
                 try:
-                    row = new_cell.get('row')
-                    col = new_cell.get('col')
-                    
-                    # Fallback si row/col ne sont pas dans new_cell
-                    if row is None or col is None:
-                        cell_index = new_cell['index']
-                        row = ((cell_index - 1) // nbr_cols) + 1
-                        col = ((cell_index - 1) % nbr_cols) + 1
-                        write_log("WARNING: Using fallback row/col calculation for overlay")
-                    
-                    write_log("Placing overlay for cell R{0}C{1}".format(row, col))
-                    
-                    # Calculer l'index de l'overlay (meme logique que createOpenBoard.py)
-                    overlay_index = get_overlay_index_for_cell(row, col, nbr_cols, len(overlay_files), cell_type)
-                    if overlay_index >= len(overlay_files):
-                        overlay_index = overlay_index % len(overlay_files)
-                    
-                    overlay_path = overlay_files[overlay_index]
-                    write_log("Using overlay file: {0} (index {1})".format(overlay_path, overlay_index))
-                    
-                    # Determiner l'orientation de l'overlay
-                    orientation = get_image_orientation(overlay_path)
-                    write_log("Overlay orientation: {0}".format(orientation))
-                    
-                    # Calculer les dimensions et positions
-                    position_info = calculate_overlay_dimensions(
-                        cell_width_calc, cell_height_calc, cell_type, orientation, margin_size
-                    )
+                    (overlay_path, position_info, next_overlay_path,
+                     row, col) = overlay_schedule[new_cell['index']]
+                    write_log_debug("Placing overlay {0} for cell R{1}C{2}", None,
+                                    overlay_path, row, col)
                     
                     # Placer l'overlay selon le type (exactement comme dans V1)
                     if position_info['position'] == 'center':
                         # Placement centre (Single ou Landscape en Spread)
                         place_overlay_in_cell(
                             img, overlay_path, cell_lx, cell_ty, 
-                            cell_width_calc, cell_height_calc,
+                            cw, ch,
                             cell_type, overlay_group, position_info
                         )
                     elif position_info['position'] == 'split':
@@ -816,14 +971,7 @@ def extend_board(img, dit_path, cells, metadata, extension_direction, cell_type,
                             cell_type, overlay_group, left_info
                         )
                         
-                        # Placer l'overlay droit (même fichier si un seul overlay, sinon fichier suivant)
-                        if len(overlay_files) > 1:
-                            next_index = (overlay_index + 1) % len(overlay_files)
-                            next_overlay_path = overlay_files[next_index]
-                        else:
-                            # Un seul overlay : utiliser le même fichier pour les deux côtés
-                            next_overlay_path = overlay_path
-                        
+                        # Placer l'overlay droit
                         right_info = {
                             'position': 'center',
                             'dimensions': position_info['dimensions']['right']
@@ -836,31 +984,48 @@ def extend_board(img, dit_path, cells, metadata, extension_direction, cell_type,
                             cell_type, overlay_group, right_info
                         )
                     
-                    write_log("Overlay placed successfully for cell R{0}C{1}".format(row, col))
+                    write_log_debug("Overlay placed successfully for cell R{0}C{1}".format(row, col))
                     
                 except Exception as e:
                     write_log("WARNING: Could not place overlay on new cell: {0}".format(e))
                     import traceback
                     write_log("Traceback: {0}".format(traceback.format_exc()))
         
+        # Clear all accumulated holes - one selection + one clear per layer
+        if mask_rects:
+            try:
+                _select_rects(img, mask_rects)
+                pdb.gimp_edit_clear(mask_layer)
+                pdb.gimp_selection_none(img)
+            except Exception as e:
+                write_log("WARNING: Could not update Mask: {0}".format(e))
+        
+        if border_rects:
+            try:
+                _select_rects(img, border_rects)
+                pdb.gimp_edit_clear(borders_layer)
+                pdb.gimp_selection_none(img)
+            except Exception as e:
+                write_log("WARNING: Could not update Borders: {0}".format(e))
+        
+        if gutter_rects:
+            try:
+                _select_rects(img, gutter_rects)
+                pdb.gimp_context_set_foreground((34, 34, 34))
+                pdb.gimp_edit_fill(gutters_layer, FILL_FOREGROUND)
+                pdb.gimp_selection_none(img)
+                write_log_debug("Created {0} gutters", None, len(gutter_rects))
+            except Exception as e:
+                write_log("WARNING: Could not create gutters: {0}".format(e))
+        
+        pdb.gimp_context_pop()
+        
         write_log("All visual elements updated")
         
         # REPOSITION LEGEND
         try:
             write_log("Searching for Legend layer...")
-            legend_layer = None
-            
-            if board_elements_group:
-                for child in board_elements_group.children:
-                    if pdb.gimp_item_get_name(child) == "Legend":
-                        legend_layer = child
-                        break
-            
-            if not legend_layer:
-                for layer in img.layers:
-                    if not pdb.gimp_item_is_group(layer) and pdb.gimp_item_get_name(layer) == "Legend":
-                        legend_layer = layer
-                        break
+            legend_layer = layer_index.get('Legend')
             
             if legend_layer:
                 current_x, current_y = pdb.gimp_drawable_offsets(legend_layer)
@@ -882,47 +1047,43 @@ def extend_board(img, dit_path, cells, metadata, extension_direction, cell_type,
         except Exception as e:
             write_log("WARNING: Could not reposition Legend: {0}".format(e))
         
-        # Update .board file
+        # Update .board file - réécriture en une seule passe vers un fichier
+        # temporaire, puis remplacement : pas de readlines() ni de listes
+        # intermédiaires, et le .board d'origine reste intact en cas d'erreur
         try:
-            with open(dit_path, 'r') as f:
-                lines = f.readlines()
-            
-            metadata_lines = []
-            cell_lines = []
-            
-            for line in lines:
-                line = line.strip()
-                if not line:
-                    continue
-                if line.startswith('#'):
-                    metadata_lines.append(line)
-                elif line[0].isdigit():
-                    cell_lines.append(line)
-            
-            new_metadata = []
-            for line in metadata_lines:
-                if line.startswith('#nbrCols='):
-                    new_metadata.append('#nbrCols={0}'.format(nbr_cols))
-                elif line.startswith('#nbrRows='):
-                    new_metadata.append('#nbrRows={0}'.format(nbr_rows))
-                else:
-                    new_metadata.append(line)
-            
-            for new_cell in new_cells:
-                cell_line = "{0},{1},{2},{3},{4},{5},{6},{7},{8}".format(
-                    new_cell['index'],
-                    int(new_cell['minX']), int(new_cell['minY']),
-                    int(new_cell['minX']), int(new_cell['maxY']),
-                    int(new_cell['maxX']), int(new_cell['maxY']),
-                    int(new_cell['maxX']), int(new_cell['minY'])
-                )
-                cell_lines.append(cell_line)
+            tmp_path = dit_path + ".tmp"
+            with open(dit_path, 'r') as fin, open(tmp_path, 'w') as fout:
+                for line in fin:
+                    stripped = line.strip()
+                    if not stripped:
+                        continue
+                    if stripped.startswith('#nbrCols='):
+                        fout.write('#nbrCols={0}\n'.format(nbr_cols))
+                    elif stripped.startswith('#nbrRows='):
+                        fout.write('#nbrRows={0}\n'.format(nbr_rows))
+                    else:
+                        fout.write(stripped + '\n')
+                
+                # Lignes des nouvelles cellules assemblées puis écrites en
+                # un seul write au lieu d'un write par cellule
+                tmpl = "{0},{1},{2},{3},{4},{5},{6},{7},{8}\n".format
+                fout.write(''.join(
+                    tmpl(nc['index'],
+                         int(nc['minX']), int(nc['minY']),
+                         int(nc['minX']), int(nc['maxY']),
+                         int(nc['maxX']), int(nc['maxY']),
+                         int(nc['maxX']), int(nc['minY']))
+                    for nc in new_cells
+                ))
             
-            with open(dit_path, 'w') as f:
-                for line in new_metadata:
-                    f.write(line + '\n')
-                for line in cell_lines:
-                    f.write(line + '\n')
+            if hasattr(os, 'replace'):
+                os.replace(tmp_path, dit_path)
+            else:
+                # Python 2 : pas d'os.replace ; rename est atomique sur
+                # POSIX mais n'écrase pas sous Windows
+                if os.name == 'nt' and os.path.exists(dit_path):
+                    os.remove(dit_path)
+                os.rename(tmp_path, dit_path)
             
             write_log("Updated .board file with {0} new cells".format(len(new_cells)))
         except Exception as e:
@@ -932,39 +1093,48 @@ def extend_board(img, dit_path, cells, metadata, extension_direction, cell_type,
         pdb.gimp_displays_flush()
         
         # Save direction for alternate mode
-        if alternate_pref_file is not None:
-            try:
-                direction_to_save = ["Bottom", "Right"][effective_direction]
-                with open(alternate_pref_file, 'w') as f:
-                    f.write(direction_to_save)
-                write_log("Saved direction: {0}".format(direction_to_save))
-            except:
-                pass
+        if extension_direction == 2:
+            direction_to_save = ["Bottom", "Right"][effective_direction]
+            _last_direction_cache[dit_path] = direction_to_save
+            write_log("Saved direction: {0}".format(direction_to_save))
         
         write_log("====== Board extension completed ======")
-        return True
+        
+        # Retourner les données à jour (même forme que read_dit_file) :
+        # l'appelant n'a plus besoin de re-parser le .board qui vient
+        # d'être écrit à partir de ces mêmes structures
+        metadata['nbrCols'] = str(nbr_cols)
+        metadata['nbrRows'] = str(nbr_rows)
+        return {
+            'cells': cells + new_cells,
+            'metadata': metadata,
+            'overlay_files': overlay_files if overlay_files else []
+        }
     except Exception as e:
         write_log("ERROR in extend_board: {0}".format(e))
-        return False
+        return None
+    finally:
+        if undo_started:
+            pdb.gimp_image_undo_group_end(img)
 
 # ============================================================================
 # MAIN IMPORT FUNCTION
 # ============================================================================
 
 def import_images_to_board(img, image_files, cell_type, resize_mode, start_cell, 
-                          auto_extend=False, extension_direction=0, user_overlay_files=None, should_create_guides=False):
+                          auto_extend=False, extension_direction=0, user_overlay_files=None, should_create_guides=False,
+                          auto_save=True):
     """Main import function - AVEC CACHE DE SESSION pour performance optimale"""
     global log_file_path
-    
+
+    cell_type = cell_type.lower()
+
     board_path = pdb.gimp_image_get_filename(img)
     if board_path:
         board_dir = os.path.dirname(board_path)
         board_name = os.path.splitext(os.path.basename(board_path))[0]
         log_file_path = os.path.join(board_dir, "{0}_import.log".format(board_name))
-        
-        # Fichier de préférence pour mode Alternate (à nettoyer à la fin)
-        alternate_pref_file = os.path.join(board_dir, "extension_direction.txt")
-        
+
         write_log("====== GIMP Board Import Started ======", log_file_path)
         write_log("Board: {0}".format(board_path), log_file_path)
     else:
@@ -1000,6 +1170,13 @@ def import_images_to_board(img, image_files, cell_type, resize_mode, start_cell,
     write_log("Board has {0} cells".format(len(cells)), log_file_path)
     
     # 🔥 CONSTRUIRE LE CACHE DE SESSION (UNE SEULE FOIS)
+    # Oublier les scans mémorisés des imports précédents : l'utilisateur
+    # a pu déplacer ou masquer des layers sans toucher à la structure du
+    # groupe, le build initial doit relire la géométrie réelle. Même
+    # logique pour l'index des masques : un masque remplacé entre deux
+    # imports garde le même nombre d'enfants, seul un reset est fiable
+    reset_group_scan_cache()
+    _mask_index_cache.clear()
     write_log("====== BUILDING SESSION CACHE ======", log_file_path)
     cache_start_time = time.time()
     layer_bounds_cache = build_layer_bounds_cache(img)
@@ -1017,45 +1194,73 @@ def import_images_to_board(img, image_files, cell_type, resize_mode, start_cell,
         undo_started = True
         
         import_start_time = time.time()
-        
-        for i, image_file in enumerate(image_files):
-            write_log("====== Processing {0}/{1}: {2} ======".format(
-                i + 1, total_images, os.path.basename(image_file)), log_file_path)
+
+        # Précalculer chemin / basename / nom de layer une seule fois par
+        # fichier ; la boucle déballe le tuple sans relecture de dicts
+        file_info = []
+        for p in image_files:
+            basename = os.path.basename(p)
+            file_info.append((p, basename, os.path.splitext(basename)[0]))
+
+        # Sondes d'orientation parallélisées avant la boucle : lectures
+        # d'en-têtes uniquement, les disques se recouvrent au lieu de
+        # s'enchaîner entre deux appels PDB
+        prefetch_image_orientations(image_files)
+
+        # Indices de reprise par orientation : pendant un import on ne fait
+        # qu'AJOUTER des layers, donc une cellule refusée pour une
+        # orientation donnée le reste. Inutile de re-scanner ce préfixe à
+        # chaque image — on reprend le scan là où le précédent s'est arrêté.
+        # (Les cellules d'extension sont toujours ajoutées en fin de liste,
+        # les indices restent donc valides après un extend_board.)
+        scan_start = {}
+
+        for i, (image_file, image_basename, layer_name) in enumerate(file_info):
+            write_log("====== Processing {0}/{1}: {2} ======", log_file_path,
+                i + 1, total_images, image_basename)
             
-            pdb.gimp_progress_update(float(i) / float(total_images))
+            _throttled_progress(float(i) / float(total_images))
             
             orientation = get_image_orientation(image_file)
             
             # 🔥 UTILISER LE CACHE pour trouver une cellule vide (10-15x plus rapide)
+            start = scan_start.get(orientation, 0)
             empty_cell, use_side = find_empty_cell_cached(
-                cells, cell_type, orientation, layer_bounds_cache)
-            
+                cells[start:] if start else cells, cell_type, orientation,
+                layer_bounds_cache)
+            if empty_cell is not None:
+                scan_start[orientation] = cells.index(empty_cell, start)
+
             if empty_cell is None and auto_extend:
                 write_log("No empty cell, extending board...", log_file_path)
-                extension_success = extend_board(img, dit_path, cells, metadata, 
+                # Toutes les cellules actuelles sont pleines pour cette
+                # orientation : le prochain scan ne regardera que les
+                # cellules créées par l'extension
+                scan_start[orientation] = len(cells)
+                board_data = extend_board(img, dit_path, cells, metadata,
                                                 extension_direction, cell_type, overlay_files)
                 
-                if extension_success:
-                    board_data = read_dit_file(dit_path)
-                    if board_data:
-                        cells = board_data['cells']
-                        metadata = board_data['metadata']
-                        if not user_overlay_files:
-                            overlay_files = board_data.get('overlay_files', [])
-                        write_log("New cell count: {0}".format(len(cells)), log_file_path)
-                        
-                        # 🔥 RECONSTRUIRE LE CACHE après extension du board
-                        write_log("Rebuilding cache after board extension...", log_file_path)
-                        rebuild_start = time.time()
-                        layer_bounds_cache = build_layer_bounds_cache(img)
-                        rebuild_time = time.time() - rebuild_start
-                        write_log("Cache rebuilt in {0:.3f}s".format(rebuild_time), log_file_path)
-                        
-                        # Nouvelle recherche avec cache mis à jour
-                        empty_cell, use_side = find_empty_cell_cached(
-                            cells, cell_type, orientation, layer_bounds_cache)
+                if board_data:
+                    # Données retournées directement : pas de re-parse du
+                    # .board qui vient d'être écrit
+                    cells = board_data['cells']
+                    metadata = board_data['metadata']
+                    # overlay_files est figé avant la boucle : une extension
+                    # ne modifie pas la liste d'overlays du .board, inutile
+                    # de la relier à chaque extension
+                    write_log("New cell count: {0}".format(len(cells)), log_file_path)
+                    
+                    # Pas de reconstruction du cache : l'extension ajoute des
+                    # cellules vides mais aucun layer dans Board Content, les
+                    # bounds déjà en cache restent valides
+                    start = scan_start.get(orientation, 0)
+                    empty_cell, use_side = find_empty_cell_cached(
+                        cells[start:] if start else cells, cell_type,
+                        orientation, layer_bounds_cache)
+                    if empty_cell is not None:
+                        scan_start[orientation] = cells.index(empty_cell, start)
                 
-                if not extension_success or empty_cell is None:
+                if not board_data or empty_cell is None:
                     write_log("Extension failed, stopping", log_file_path)
                     images_failed = total_images - i
                     break
@@ -1065,19 +1270,19 @@ def import_images_to_board(img, image_files, cell_type, resize_mode, start_cell,
                 images_failed = total_images - i
                 break
             
-            success = place_image_in_cell(img, image_file, empty_cell, cell_type, 
-                                         resize_mode, metadata, cells, use_side, should_create_guides)
+            placed_layer = place_image_in_cell(img, image_file, empty_cell, cell_type,
+                                         resize_mode, metadata, cells, use_side, should_create_guides,
+                                         layer_name, orientation)
             
-            if success:
+            if placed_layer:
                 images_placed += 1
                 
-                # 🔥 CRITIQUE : Reconstruire le cache après chaque placement
-                # Cela garantit que les cellules occupées sont détectées correctement
-                # Le coût est minime (<0.1s) comparé au gain global
-                cache_rebuild_start = time.time()
-                layer_bounds_cache = build_layer_bounds_cache(img)
-                cache_rebuild_time = time.time() - cache_rebuild_start
-                write_log("Cache updated after placement in {0:.3f}s".format(cache_rebuild_time), log_file_path)
+                # 🔥 Mise à jour incrémentale différée : seule la référence
+                # du layer placé entre au cache, sa géométrie sera lue par
+                # le prochain scan qui en a besoin
+                if not add_layer_to_cache(layer_bounds_cache, placed_layer):
+                    write_log("Incremental cache update failed, rebuilding...", log_file_path)
+                    layer_bounds_cache = build_layer_bounds_cache(img)
             else:
                 images_failed += 1
         
@@ -1094,8 +1299,9 @@ def import_images_to_board(img, image_files, cell_type, resize_mode, start_cell,
         # 🔥 Le cache est automatiquement détruit ici (fin de scope)
         write_log("Session cache destroyed (end of import)", log_file_path)
         
-        # Auto-save
-        if images_placed > 0 and board_path:
+        # Auto-save : uniquement si demandé et si des placements justifient
+        # la réécriture complète du XCF (gros boards = gros fichiers)
+        if auto_save and images_placed > 0 and board_path:
             try:
                 write_log("Auto-saving XCF file", log_file_path)
                 pdb.gimp_xcf_save(0, img, img.layers[0], board_path, board_path)
@@ -1108,6 +1314,8 @@ def import_images_to_board(img, image_files, cell_type, resize_mode, start_cell,
                 write_log("Import completed: {0} image(s) placed but save failed.".format(images_placed), log_file_path)
                 # pdb.gimp_message("Import completed: {0} image(s) placed but save failed.".format(images_placed))
         elif images_placed > 0:
+            if not auto_save:
+                write_log("Auto-save disabled, skipping XCF save", log_file_path)
             write_log("Import completed: {0} image(s) placed.".format(images_placed), log_file_path)
             # pdb.gimp_message("Import completed: {0} image(s) placed.".format(images_placed))
         
@@ -1122,13 +1330,13 @@ def import_images_to_board(img, image_files, cell_type, resize_mode, start_cell,
             except:
                 pass
         
-        # 🧹 Nettoyage : Supprimer le fichier de préférence du mode Alternate
-        try:
-            if 'alternate_pref_file' in locals() and os.path.exists(alternate_pref_file):
-                os.remove(alternate_pref_file)
-                write_log("Cleaned up extension_direction.txt", log_file_path)
-        except Exception as cleanup_error:
-            write_log("Warning: Could not remove extension_direction.txt: {0}".format(cleanup_error), log_file_path)
+        # 🧹 Libérer les images temporaires mises en pool (overlays, sondes
+        # d'orientation des formats non parsables)
+        flush_temp_image_pool()
+        
+        # 🧹 Réinitialiser la direction du mode Alternate pour le prochain
+        # import (équivalent de l'ancienne suppression du fichier de pref)
+        _last_direction_cache.pop(dit_path, None)
         
         pdb.gimp_displays_flush()
 
@@ -1138,7 +1346,8 @@ def import_images_to_board(img, image_files, cell_type, resize_mode, start_cell,
 
 def import_board_ui(img, drawable, import_mode, image_folder, image_file, image_pattern, 
                    cell_type, resize_mode, start_cell, overlay_enabled, overlay_file, 
-                   overlay_folder, auto_extend, extension_direction, should_create_guides):
+                   overlay_folder, auto_extend, extension_direction, should_create_guides,
+                   auto_save):
     """User interface for import"""
     
     image_files = []
@@ -1161,12 +1370,16 @@ def import_board_ui(img, drawable, import_mode, image_folder, image_file, image_
             pdb.gimp_message("Please select a valid folder")
             return
         
-        extensions = ['*.jpg', '*.jpeg', '*.png', '*.tif', '*.tiff', '*.psd', '*.bmp',
-                     '*.JPG', '*.JPEG', '*.PNG', '*.TIF', '*.TIFF', '*.PSD', '*.BMP']
+        # Une seule lecture du dossier filtrée par extension (insensible à
+        # la casse) au lieu de 14 passes glob — un seul listdir suffit
+        extensions = frozenset(['.jpg', '.jpeg', '.png', '.tif', '.tiff',
+                                '.psd', '.bmp'])
         
-        for ext in extensions:
-            pattern = os.path.join(image_folder, ext)
-            image_files.extend(glob.glob(pattern))
+        for filename in os.listdir(image_folder):
+            if os.path.splitext(filename)[1].lower() in extensions:
+                file_path = os.path.join(image_folder, filename)
+                if os.path.isfile(file_path):
+                    image_files.append(file_path)
     
     elif mode_name == "Single Image":
         if not image_file or not os.path.isfile(image_file):
@@ -1203,7 +1416,8 @@ def import_board_ui(img, drawable, import_mode, image_folder, image_file, image_
     pdb.gimp_progress_init("Importing {0} image(s)...".format(len(image_files)), None)
     
     import_images_to_board(img, image_files, cell_type_str, resize_mode_str, start_cell, 
-                          auto_extend, extension_direction, user_overlay_files, should_create_guides)
+                          auto_extend, extension_direction, user_overlay_files, should_create_guides,
+                          auto_save)
 
 # ============================================================================
 # PLUGIN REGISTRATION
@@ -1232,7 +1446,8 @@ register(
         (PF_DIRNAME, "overlay_folder", "Overlay Folder", ""),
         (PF_TOGGLE, "auto_extend", "─────────── ⚙️  EXTENSION ───────────\nAuto-extend", True),
         (PF_OPTION, "extension_direction", "Direction", 2, ["Bottom", "Right", "Alternate"]),
-        (PF_TOGGLE, "should_create_guides", "─────────── 📏 GUIDES ───────────\nCreate Guides", False)
+        (PF_TOGGLE, "should_create_guides", "─────────── 📏 GUIDES ───────────\nCreate Guides", False),
+        (PF_TOGGLE, "auto_save", "─────────── 💾 SAVE ───────────\nAuto-save XCF", True)
     ],
     [],
     import_board_ui
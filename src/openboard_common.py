@@ -17,14 +17,28 @@ import os
 import time
 import math
 import re
+import struct
+import atexit
+import threading
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict, namedtuple
+from operator import itemgetter
 
 # ============================================================================
 # CONSTANTS
 # ============================================================================
 
 ENABLE_LOGS = False  # Activer/désactiver l'écriture des logs
-IMAGE_EXTENSIONS = ['.png', '.jpg', '.jpeg', '.tif', '.tiff', '.xcf', 
-                   '.psd', '.bmp', '.gif']
+# Niveau de verbosité : 1 = messages de synthèse, 2 = détails par cellule.
+# Une valeur malformée ne doit pas faire échouer l'import du module (et
+# donc l'enregistrement des trois plugins) : on retombe sur 1.
+try:
+    LOG_LEVEL = int(os.environ.get('OPENBOARD_LOG_LEVEL', '1'))
+except ValueError:
+    LOG_LEVEL = 1
+# frozenset : les tests d'appartenance (filtrage de dossiers) sont O(1)
+IMAGE_EXTENSIONS = frozenset(['.png', '.jpg', '.jpeg', '.tif', '.tiff',
+                              '.xcf', '.psd', '.bmp', '.gif'])
 DEFAULT_DPI = 72.0
 POSITION_TOLERANCE = 10  # pixels
 MIN_LAYER_SIZE = 100  # Taille minimale de layer à considérer
@@ -38,44 +52,77 @@ VERY_WIDE_IMAGE_THRESHOLD = 0.8  # 80% de la largeur de cellule
 # LOGGING
 # ============================================================================
 
-def write_log(message, log_file_path=None):
+# Handles de fichiers log ouverts une fois par session et bufferisés :
+# chaque write_log coûtait un open/write/close (trois syscalls par ligne)
+_LOG_HANDLES = {}
+
+# Horodatage mémoïsé à la seconde : les rafales de logs d'une même
+# itération partagent le même strftime
+_LAST_TIMESTAMP = [0, '']
+
+def _close_log_handles():
+    for handle in _LOG_HANDLES.values():
+        try:
+            handle.close()
+        except Exception:
+            pass
+    _LOG_HANDLES.clear()
+
+atexit.register(_close_log_handles)
+
+def write_log(message, log_file_path=None, *format_args):
     """Écrire un message dans le log avec timestamp.
-    
+
     Cette fonction gère l'écriture des logs de manière centralisée.
     Elle respecte la constante ENABLE_LOGS pour activer/désactiver les logs.
-    
+
     Args:
-        message (str): Message à logger
+        message (str): Message à logger (gabarit str.format si format_args)
         log_file_path (str, optional): Chemin vers le fichier log.
             Si None, affiche seulement dans la console.
-        
+        *format_args: Arguments de formatage paresseux. Le message n'est
+            formaté que si les logs sont activés, ce qui évite de construire
+            des chaînes inutiles dans les boucles chaudes.
+
     Returns:
         bool: True si succès, False si erreur
-        
+
     Example:
         >>> write_log("Import started")
         2025-10-03 14:30:00 - Import started
         True
-        
+        >>> write_log("Placed {0} images", None, 12)
+        2025-10-03 14:30:01 - Placed 12 images
+        True
+
     Note:
         En cas d'erreur d'écriture du fichier, le message est quand même
         affiché dans la console et la fonction retourne False.
     """
     if not ENABLE_LOGS:
         return True
-    
+
     try:
-        timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
-        full_message = "{0} - {1}".format(timestamp, message)
+        if format_args:
+            message = message.format(*format_args)
+        now = int(time.time())
+        if now != _LAST_TIMESTAMP[0]:
+            _LAST_TIMESTAMP[0] = now
+            _LAST_TIMESTAMP[1] = time.strftime("%Y-%m-%d %H:%M:%S")
+        full_message = "{0} - {1}".format(_LAST_TIMESTAMP[1], message)
         
         # Toujours afficher dans la console
         print(full_message)
         
-        # Écrire dans le fichier si spécifié
+        # Écrire dans le fichier si spécifié (handle bufferisé, ouvert une
+        # seule fois par session et refermé par atexit)
         if log_file_path:
             try:
-                with open(log_file_path, 'a') as f:
-                    f.write(full_message + '\n')
+                handle = _LOG_HANDLES.get(log_file_path)
+                if handle is None:
+                    handle = open(log_file_path, 'a')
+                    _LOG_HANDLES[log_file_path] = handle
+                handle.write(full_message + '\n')
             except IOError as e:
                 print("Error writing to log file: {0}".format(e))
                 return False
@@ -86,6 +133,27 @@ def write_log(message, log_file_path=None):
         print("Error in write_log: {0}".format(e))
         return False
 
+if not ENABLE_LOGS:
+    # Logs désactivés (cas nominal en production) : write_log devient un
+    # no-op pur. Les appels des boucles chaudes se réduisent alors à un
+    # CALL_FUNCTION qui retourne immédiatement — aucun test, aucun
+    # formatage. La version complète reste accessible pour le débogage.
+    _write_log_full = write_log
+
+    def write_log(message, log_file_path=None, *format_args):
+        return True
+
+def write_log_debug(message, log_file_path=None, *format_args):
+    """Variante de write_log réservée aux détails des boucles chaudes.
+
+    Ne fait rien tant que LOG_LEVEL < 2 (variable d'environnement
+    OPENBOARD_LOG_LEVEL) : les messages par cellule ou par fichier ne
+    coûtent alors qu'un test d'entier.
+    """
+    if LOG_LEVEL < 2:
+        return True
+    return write_log(message, log_file_path, *format_args)
+
 # ============================================================================
 # TYPE CONVERSION & VALIDATION
 # ============================================================================
@@ -113,6 +181,14 @@ def safe_float(value, default=0.0):
     Note:
         Détecte et remplace NaN et Inf par la valeur par défaut
     """
+    # Fast path : les bounds de cellules sont déjà numériques dans la
+    # grande majorité des appels
+    if type(value) is float:
+        if value != value or math.isinf(value):  # NaN ou Inf
+            return default
+        return value
+    if type(value) is int:
+        return float(value)
     try:
         result = float(value)
         if math.isnan(result) or math.isinf(result):
@@ -145,6 +221,14 @@ def safe_int(value, default=0):
         >>> safe_int("invalid", 0)
         0
     """
+    # Fast path : court-circuite le détour par safe_float pour les
+    # valeurs déjà numériques
+    if type(value) is int:
+        return value
+    if type(value) is float:
+        if value != value or math.isinf(value):  # NaN ou Inf
+            return default
+        return int(value)
     try:
         return int(safe_float(value, default))
     except (TypeError, ValueError) as e:
@@ -158,6 +242,10 @@ def safe_int(value, default=0):
 # COLOR CONVERSION
 # ============================================================================
 
+# Petit cache des chaînes hex déjà décodées : les couleurs de bordure /
+# header / footer reviennent en boucle pendant une création de board
+_HEX_RGB_CACHE = {}
+
 def convert_hex_to_rgb(color_param):
     """Convertir une couleur GIMP/hex en tuple RGB (0-255).
     
@@ -197,14 +285,20 @@ def convert_hex_to_rgb(color_param):
         
         # Format hex string
         hex_color = str(color_param).lstrip('#')
+        cached = _HEX_RGB_CACHE.get(hex_color)
+        if cached is not None:
+            return cached
+        
         if len(hex_color) != 6:
             write_log("Invalid hex color length: {0}, using white".format(hex_color))
             return (255, 255, 255)
         
-        r = int(hex_color[0:2], 16)
-        g = int(hex_color[2:4], 16)
-        b = int(hex_color[4:6], 16)
-        return (r, g, b)
+        # Un seul int() puis décalages au lieu de trois tranches + int()
+        value = int(hex_color, 16)
+        rgb = ((value >> 16) & 0xFF, (value >> 8) & 0xFF, value & 0xFF)
+        if len(_HEX_RGB_CACHE) < 64:
+            _HEX_RGB_CACHE[hex_color] = rgb
+        return rgb
         
     except (ValueError, TypeError) as e:
         write_log("Error converting color '{0}': {1}".format(color_param, e))
@@ -236,6 +330,10 @@ def convert_rgb_to_gimp_color(rgb):
 # FILE OPERATIONS
 # ============================================================================
 
+# Compilé au chargement du module : évite la recherche dans le cache de
+# re à chaque nom de fichier nettoyé
+_SANITIZE_RE = re.compile(r'[^\w\s\-.]')
+
 def sanitize_filename(filename):
     """Nettoyer un nom de fichier pour éviter les path traversal attacks.
     
@@ -261,7 +359,7 @@ def sanitize_filename(filename):
         filename = os.path.basename(filename)
         
         # Supprimer les caractères dangereux sauf alphanumériques, espaces, - . _
-        filename = re.sub(r'[^\w\s\-.]', '', filename)
+        filename = _SANITIZE_RE.sub('', filename)
         
         return filename
     except Exception as e:
@@ -323,49 +421,297 @@ def find_overlay_files(path):
 # GIMP IMAGE OPERATIONS
 # ============================================================================
 
+def _parse_exif_orientation(tiff_data):
+    """Extraire le tag Orientation (0x0112) d'un bloc TIFF/EXIF.
+
+    Parcourt uniquement l'IFD0, sans décoder le reste des métadonnées.
+
+    Args:
+        tiff_data (bytes): Contenu du segment APP1 après le préfixe "Exif\\0\\0"
+
+    Returns:
+        int: Orientation EXIF (1-8), 1 si le tag est absent,
+        ou None si le bloc est illisible
+    """
+    try:
+        if tiff_data[:2] == b'II':
+            endian = '<'
+        elif tiff_data[:2] == b'MM':
+            endian = '>'
+        else:
+            return None
+        ifd_offset = struct.unpack(endian + 'I', tiff_data[4:8])[0]
+        entry_count = struct.unpack(
+            endian + 'H', tiff_data[ifd_offset:ifd_offset + 2])[0]
+        pos = ifd_offset + 2
+        for _ in range(entry_count):
+            entry = tiff_data[pos:pos + 12]
+            if len(entry) < 12:
+                return None
+            tag = struct.unpack(endian + 'H', entry[0:2])[0]
+            if tag == 0x0112:  # Orientation (SHORT)
+                value = struct.unpack(endian + 'H', entry[8:10])[0]
+                return value if 1 <= value <= 8 else None
+            pos += 12
+        return 1
+    except Exception:
+        return None
+
+def get_image_size(image_path):
+    """Lire les dimensions d'une image depuis son header (sans décoder les pixels).
+
+    Lecture de quelques centaines d'octets au lieu d'un chargement GIMP
+    complet. Supporte PNG, JPEG, GIF, BMP et TIFF.
+
+    Args:
+        image_path (str): Chemin vers l'image
+
+    Returns:
+        tuple: (width, height) ou None si le format n'est pas reconnu
+
+    Example:
+        >>> get_image_size("/path/to/image.png")
+        (1920, 1080)
+
+    Note:
+        Les formats non supportés (.xcf, .psd) retournent None ; l'appelant
+        doit alors retomber sur un chargement GIMP classique.
+    """
+    try:
+        with open(image_path, 'rb') as f:
+            head = f.read(26)
+            if len(head) < 10:
+                return None
+
+            # PNG : IHDR juste après la signature
+            if head.startswith(b'\x89PNG\r\n\x1a\n'):
+                width, height = struct.unpack('>II', head[16:24])
+                return (int(width), int(height))
+
+            # GIF : dimensions dans le Logical Screen Descriptor
+            if head[:6] in (b'GIF87a', b'GIF89a'):
+                width, height = struct.unpack('<HH', head[6:10])
+                return (int(width), int(height))
+
+            # BMP : header BITMAPINFOHEADER
+            if head.startswith(b'BM') and len(head) >= 26:
+                width, height = struct.unpack('<ii', head[18:26])
+                return (int(width), abs(int(height)))
+
+            # JPEG : chercher le premier marqueur SOFn. Les dimensions SOF
+            # sont celles d'AVANT rotation EXIF ; GIMP applique cette
+            # rotation au chargement, donc on lit aussi le tag Orientation
+            # dans l'APP1 pour rester cohérent avec le layer chargé.
+            if head.startswith(b'\xff\xd8'):
+                f.seek(2)
+                orientation = 1
+                exif_unreadable = False
+                while True:
+                    marker = f.read(2)
+                    if len(marker) < 2 or marker[0:1] != b'\xff':
+                        return None
+                    code = ord(marker[1:2])
+                    if 0xC0 <= code <= 0xCF and code not in (0xC4, 0xC8, 0xCC):
+                        f.read(3)  # longueur du segment + précision
+                        height, width = struct.unpack('>HH', f.read(4))
+                        if exif_unreadable:
+                            # EXIF présent mais illisible : on ne sait pas
+                            # si les dimensions seront transposées, laisser
+                            # l'appelant retomber sur le chargement GIMP
+                            return None
+                        if orientation in (5, 6, 7, 8):
+                            width, height = height, width
+                        return (int(width), int(height))
+                    length_data = f.read(2)
+                    if len(length_data) < 2:
+                        return None
+                    seg_len = struct.unpack('>H', length_data)[0] - 2
+                    if code == 0xE1 and seg_len > 0:
+                        segment = f.read(seg_len)
+                        if segment.startswith(b'Exif\x00\x00'):
+                            parsed = _parse_exif_orientation(segment[6:])
+                            if parsed is None:
+                                exif_unreadable = True
+                            else:
+                                orientation = parsed
+                    else:
+                        f.seek(seg_len, 1)
+
+            # TIFF : parcourir le premier IFD
+            if head[:4] in (b'II*\x00', b'MM\x00*'):
+                endian = '<' if head[:2] == b'II' else '>'
+                f.seek(struct.unpack(endian + 'I', head[4:8])[0])
+                entry_count = struct.unpack(endian + 'H', f.read(2))[0]
+                width = height = None
+                for _ in range(entry_count):
+                    entry = f.read(12)
+                    if len(entry) < 12:
+                        break
+                    tag, field_type = struct.unpack(endian + 'HH', entry[0:4])
+                    if tag in (256, 257):  # ImageWidth / ImageLength
+                        if field_type == 3:  # SHORT
+                            value = struct.unpack(endian + 'H', entry[8:10])[0]
+                        else:  # LONG
+                            value = struct.unpack(endian + 'I', entry[8:12])[0]
+                        if tag == 256:
+                            width = value
+                        else:
+                            height = value
+                    if width is not None and height is not None:
+                        return (int(width), int(height))
+
+        return None
+
+    except Exception as e:
+        write_log("Error reading header of {0}: {1}".format(image_path, e))
+        return None
+
+# Cache des orientations par chemin : un même fichier placé dans plusieurs
+# cellules (mockups, previews) n'est sondé qu'une seule fois par batch
+_orientation_cache = {}
+
 def get_image_orientation(image_path):
     """Obtenir l'orientation d'une image (Landscape/Portrait/Square).
-    
-    IMPORTANT: Charge et décharge proprement l'image temporaire pour éviter
-    les fuites mémoire dans GIMP.
-    
+
+    Utilise get_image_size() (lecture du header uniquement) quand le format
+    le permet ; sinon charge et décharge proprement une image temporaire
+    pour éviter les fuites mémoire dans GIMP. Le résultat est mémoïsé par
+    (chemin, mtime, taille) pour toute la session : un fichier remplacé
+    sur disque est re-sondé, un fichier inchangé ne l'est jamais.
+
     Args:
         image_path (str): Chemin vers l'image
-        
+
     Returns:
         str: "Landscape", "Portrait", ou "Square"
-        
+
     Example:
         >>> get_image_orientation("/path/to/image.jpg")
         "Landscape"
-        
+
     Note:
-        Retourne "Portrait" par défaut en cas d'erreur
+        Retourne "Portrait" par défaut en cas d'erreur (non mémoïsé)
         Utilise un bloc finally pour garantir le nettoyage
     """
-    temp_img = None
     try:
-        temp_img = pdb.gimp_file_load(image_path, image_path)
-        width = temp_img.width
-        height = temp_img.height
-        
-        if width > height:
-            return "Landscape"
-        elif height > width:
+        st = os.stat(image_path)
+        cache_key = (image_path, st.st_mtime, st.st_size)
+    except OSError:
+        cache_key = image_path
+
+    cached = _orientation_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    size = get_image_size(image_path)
+
+    if size is None:
+        # Fallback : formats non parsables (.xcf, .psd) via le pool GIMP
+        # (l'image reste disponible pour un éventuel placement ultérieur)
+        try:
+            temp_img = _load_temp_image(image_path)
+            size = (temp_img.width, temp_img.height)
+        except Exception as e:
+            write_log("Error getting orientation for {0}: {1}".format(image_path, e))
             return "Portrait"
-        else:
-            return "Square"
-            
-    except Exception as e:
-        write_log("Error getting orientation for {0}: {1}".format(image_path, e))
-        return "Portrait"
-    finally:
-        # CRITIQUE: Toujours nettoyer l'image temporaire
-        if temp_img is not None:
+
+    width, height = size
+    if width > height:
+        orientation = "Landscape"
+    elif height > width:
+        orientation = "Portrait"
+    else:
+        orientation = "Square"
+
+    _orientation_cache[cache_key] = orientation
+    return orientation
+
+def prefetch_image_orientations(image_paths, max_workers=4):
+    """Pré-remplir le cache d'orientation par lectures d'en-têtes parallèles.
+
+    Seul get_image_size est appelé dans les workers (I/O fichier pur,
+    aucun appel PDB : le PDB de GIMP n'est pas thread-safe). Les lectures
+    d'en-têtes se recouvrent ainsi au lieu de s'enchaîner dans la boucle
+    d'import ; les formats non parsables (.xcf, .psd) sont laissés au
+    fallback GIMP du thread principal.
+
+    Args:
+        image_paths (list): Chemins des images à sonder
+        max_workers (int): Nombre maximal de threads
+    """
+    pending = list(image_paths)
+    lock = threading.Lock()
+
+    def worker():
+        while True:
+            with lock:
+                if not pending:
+                    return
+                path = pending.pop()
             try:
-                pdb.gimp_image_delete(temp_img)
-            except Exception as cleanup_error:
-                write_log("Error cleaning up temp image: {0}".format(cleanup_error))
+                st = os.stat(path)
+                cache_key = (path, st.st_mtime, st.st_size)
+            except OSError:
+                continue
+            if cache_key in _orientation_cache:
+                continue
+            size = get_image_size(path)
+            if size is None:
+                continue
+            width, height = size
+            if width > height:
+                orientation = "Landscape"
+            elif height > width:
+                orientation = "Portrait"
+            else:
+                orientation = "Square"
+            _orientation_cache[cache_key] = orientation
+
+    count = min(max_workers, len(pending))
+    if count <= 1:
+        worker()
+        return
+    threads = []
+    for _ in range(count):
+        t = threading.Thread(target=worker)
+        t.daemon = True
+        t.start()
+        threads.append(t)
+    for t in threads:
+        t.join()
+
+# Pool LRU d'images temporaires GIMP : les overlays cyclés et les formats
+# non parsables (.xcf, .psd) rechargeaient le même fichier à chaque usage,
+# soit un cycle allocation/libération complet dans le tile manager par appel
+_TEMP_IMG_POOL = OrderedDict()
+_TEMP_IMG_POOL_MAX = 4
+
+def _load_temp_image(path):
+    """Charger une image temporaire en réutilisant le pool LRU.
+
+    L'image retournée appartient au pool : ne PAS la supprimer via
+    pdb.gimp_image_delete, le pool s'en charge à l'éviction ou au flush.
+    """
+    temp_img = _TEMP_IMG_POOL.pop(path, None)
+    if temp_img is None:
+        temp_img = pdb.gimp_file_load(path, path)
+    _TEMP_IMG_POOL[path] = temp_img
+    while len(_TEMP_IMG_POOL) > _TEMP_IMG_POOL_MAX:
+        _, evicted = _TEMP_IMG_POOL.popitem(last=False)
+        try:
+            pdb.gimp_image_delete(evicted)
+        except Exception as cleanup_error:
+            write_log("Error evicting temp image: {0}".format(cleanup_error))
+    return temp_img
+
+def flush_temp_image_pool():
+    """Vider le pool d'images temporaires (fin d'import)."""
+    while _TEMP_IMG_POOL:
+        _, temp_img = _TEMP_IMG_POOL.popitem(last=False)
+        try:
+            pdb.gimp_image_delete(temp_img)
+        except Exception as cleanup_error:
+            write_log("Error cleaning up temp image: {0}".format(cleanup_error))
 
 def create_guide(img, position, orientation):
     """Créer un guide horizontal ou vertical dans l'image.
@@ -443,9 +789,14 @@ def calculate_overlay_dimensions(cell_width, cell_height, cell_type,
 def place_overlay_in_cell(img, overlay_path, cell_x, cell_y, cell_width, 
                           cell_height, cell_type, overlay_group, position_info):
     """Placer un overlay dans une cellule.
-    
+
     Charge l'overlay, le redimensionne et le positionne selon position_info.
-    
+
+    Note:
+        Le layer créé vit dans le groupe Overlay, pas dans Board Content :
+        il n'entre donc jamais dans le cache de bounds et aucune mise à
+        jour (incrémentale ou non) du cache n'est nécessaire ici.
+
     Args:
         img: Image GIMP cible
         overlay_path (str): Chemin vers l'overlay
@@ -461,14 +812,14 @@ def place_overlay_in_cell(img, overlay_path, cell_x, cell_y, cell_width,
         layer: Layer créé ou None si erreur
         
     Note:
-        Nettoie l'image temporaire chargée pour éviter les fuites mémoire
+        L'image temporaire vient du pool LRU partagé : un même fichier
+        overlay réutilisé sur plusieurs cellules n'est chargé qu'une fois
     """
-    overlay_img = None
     try:
         write_log("Placing overlay: {0}".format(overlay_path))
         
-        # Charger l'overlay
-        overlay_img = pdb.gimp_file_load(overlay_path, overlay_path)
+        # Charger l'overlay (pool LRU, pas de delete ici)
+        overlay_img = _load_temp_image(overlay_path)
         overlay_layer = overlay_img.active_layer if overlay_img.active_layer else overlay_img.layers[0]
         
         # Copier dans l'image cible
@@ -491,13 +842,6 @@ def place_overlay_in_cell(img, overlay_path, cell_x, cell_y, cell_width,
     except Exception as e:
         write_log("Error placing overlay: {0}".format(e))
         return None
-    finally:
-        # Nettoyer l'image temporaire
-        if overlay_img is not None:
-            try:
-                pdb.gimp_image_delete(overlay_img)
-            except Exception as cleanup_error:
-                write_log("Error cleaning up overlay image: {0}".format(cleanup_error))
 
 def get_overlay_index_for_cell(row, col, nbr_cols, overlay_count, cell_type):
     """Calculer l'index de l'overlay à utiliser pour une cellule.
@@ -532,6 +876,64 @@ def get_overlay_index_for_cell(row, col, nbr_cols, overlay_count, cell_type):
 # ============================================================================
 # PERFORMANCE - LAYER BOUNDS CACHE
 # ============================================================================
+#
+# NB : un portage du test d'occupation en extension compilée (Cython/C) a
+# été envisagé puis écarté — les plugins OpenBoard se distribuent comme
+# simples .py déposés dans le dossier plug-ins de GIMP, sans étape de
+# build ni toolchain garanti chez l'utilisateur. Le chemin pur Python
+# ci-dessous est donc optimisé en conséquence (tuples plats, invariants
+# hoistés, fenêtres bisect) ; si un jour un .so accompagne le plugin, le
+# point d'entrée à remplacer est la boucle interne de
+# find_empty_cell_cached / check_cell_occupancy_optimized.
+
+# Enregistrement du cache de bounds : namedtuple plutôt que tuple anonyme.
+# Même déballage positionnel en une instruction dans les boucles chaudes,
+# mais accès nommés (.center_x) et repr lisibles pour le reste du code.
+LayerBounds = namedtuple('LayerBounds',
+                         'x1 y1 x2 y2 center_x center_y width height name')
+
+# Mémoïsation du groupe "Board Content" par image : le scan des layers
+# racine (is_group + get_name = 2 appels PDB par layer) ne se refait que
+# si l'entrée est absente ou si le groupe mémorisé n'est plus valide
+# (supprimé/détaché depuis). Clé = img.ID, unique par session GIMP.
+_BOARD_CONTENT_CACHE = {}
+
+# Mémo du dernier scan d'enfants par groupe : (nombre d'enfants, ID de
+# l'enfant alors en tête, enregistrements produits). Permet à un rebuild
+# de ne traiter que les layers insérés depuis (les insertions se font en
+# tête du groupe) au lieu de re-payer visible+bounds+name sur chacun.
+# ATTENTION : la réutilisation n'est sûre qu'au sein d'un même import —
+# entre deux imports l'utilisateur peut déplacer ou masquer un layer sans
+# changer la structure du groupe. L'import appelle reset_group_scan_cache()
+# avant de construire son cache de session pour repartir d'un état frais.
+_GROUP_SCAN_CACHE = {}
+
+def reset_group_scan_cache():
+    """Oublier les scans d'enfants mémorisés.
+
+    À appeler au début de chaque import : le mémo ne détecte que les
+    changements structurels (ajout/retrait de layers), pas un layer
+    déplacé ou rendu invisible entre deux sessions d'import.
+    """
+    _GROUP_SCAN_CACHE.clear()
+
+def _find_board_content_group(img):
+    """Trouver (avec mémoïsation) le groupe racine "Board Content"."""
+    group = _BOARD_CONTENT_CACHE.get(img.ID)
+    if group is not None:
+        try:
+            if pdb.gimp_item_is_valid(group):
+                return group
+        except Exception:
+            pass
+        del _BOARD_CONTENT_CACHE[img.ID]
+
+    for layer in img.layers:
+        if pdb.gimp_item_is_group(layer) and \
+           pdb.gimp_item_get_name(layer) == "Board Content":
+            _BOARD_CONTENT_CACHE[img.ID] = layer
+            return layer
+    return None
 
 def get_layer_actual_bounds(layer):
     """Obtenir les bounds réels d'un layer (x1, y1, x2, y2).
@@ -547,15 +949,17 @@ def get_layer_actual_bounds(layer):
     Note:
         x1, y1 = coin supérieur gauche
         x2, y2 = coin inférieur droit
+
+        Lecture par attributs gimpfu (layer.offsets / .width / .height),
+        résolus en C côté plugin : zéro aller-retour PDB là où l'ancienne
+        version en payait trois (offsets, width, height) par layer.
     """
     try:
-        layer_offset_x, layer_offset_y = pdb.gimp_drawable_offsets(layer)
-        layer_width = pdb.gimp_drawable_width(layer)
-        layer_height = pdb.gimp_drawable_height(layer)
-        
+        layer_offset_x, layer_offset_y = layer.offsets
+
         return (layer_offset_x, layer_offset_y,
-                layer_offset_x + layer_width, 
-                layer_offset_y + layer_height)
+                layer_offset_x + layer.width,
+                layer_offset_y + layer.height)
     except Exception as e:
         write_log("Error getting layer bounds: {0}".format(e))
         return None
@@ -564,8 +968,11 @@ def build_layer_bounds_cache(img):
     """Construire un cache des bounds de tous les layers dans Board Content.
     
     CRITIQUE POUR PERFORMANCE : Cette fonction NE DOIT être appelée QU'UNE FOIS
-    au début de l'import, puis mise à jour uniquement quand une image est placée
-    ou le board étendu.
+    au début de l'import. Contrat d'invalidation : chaque mutateur met le
+    cache à jour à la source (add_layer_to_cache après un placement ; une
+    extension n'ajoute aucun layer dans Board Content, donc rien à faire) ;
+    la reconstruction complète n'est que le repli quand une mise à jour
+    incrémentale échoue.
     
     Complexité : O(L) où L = nombre de layers
     Sans cache : O(N×M×L) où N=images, M=cellules, L=layers
@@ -575,11 +982,15 @@ def build_layer_bounds_cache(img):
         img: Image GIMP active
         
     Returns:
-        list: Liste de dicts avec structure :
-            [{'name': str, 'x1': int, 'y1': int, 'x2': int, 'y2': int,
-              'center_x': float, 'center_y': float, 
-              'width': int, 'height': int}, ...]
-              
+        list: Liste de LayerBounds (namedtuple, un par layer) :
+            [LayerBounds(x1, y1, x2, y2, center_x, center_y,
+                         width, height, name), ...]
+            Se déballe en une instruction dans la boucle chaude
+            d'occupation, là où l'ancien dict coûtait 8 lookups par layer
+            et par cellule, avec en plus l'accès nommé (.center_x) hors
+            des boucles chaudes.
+
+
     Example:
         >>> cache = build_layer_bounds_cache(img)
         >>> len(cache)
@@ -594,55 +1005,75 @@ def build_layer_bounds_cache(img):
     write_log("====== Building layer bounds cache ======")
     
     layer_bounds = []
-    board_content_group = None
-    
+
     try:
-        # Trouver le groupe Board Content
-        for layer in img.layers:
-            if pdb.gimp_item_is_group(layer) and \
-               pdb.gimp_item_get_name(layer) == "Board Content":
-                board_content_group = layer
-                break
-        
+        # Trouver le groupe Board Content (mémoïsé par image)
+        board_content_group = _find_board_content_group(img)
+
         if not board_content_group:
             write_log("WARNING: Board Content group not found")
             return []
-        
-        # Parcourir tous les layers enfants
-        for layer in board_content_group.children:
-            # Ignorer les layers invisibles
-            if not pdb.gimp_item_get_visible(layer):
+
+        # Liste d'enfants liée une seule fois (la propriété gimpfu
+        # reconstruit la liste Python à chaque accès)
+        children = board_content_group.children
+
+        # Reprise incrémentale : si le groupe n'a fait que recevoir de
+        # nouveaux layers depuis le dernier build (insertion en tête via
+        # gimp_image_insert_layer position 0), seuls ceux-ci sont traités
+        # et les enregistrements précédents sont réutilisés tels quels
+        # (LayerBounds immuables). Toute autre évolution → scan complet.
+        reused_records = None
+        new_children = children
+        memo = _GROUP_SCAN_CACHE.get(board_content_group.ID)
+        if memo is not None and children:
+            prev_count, prev_first_id, prev_records = memo
+            n_new = len(children) - prev_count
+            if 0 <= n_new <= len(children) - 1 and \
+               children[n_new].ID == prev_first_id:
+                reused_records = prev_records
+                new_children = children[:n_new]
+
+        # Parcourir les layers enfants (nouveaux seulement si reprise)
+        for layer in new_children:
+            # Ignorer les layers invisibles (attribut gimpfu résolu en
+            # process : zéro aller-retour PDB, contre un par layer avant)
+            if not layer.visible:
                 continue
-            
+
             bounds = get_layer_actual_bounds(layer)
             if bounds is None:
                 continue
-            
+
             x1, y1, x2, y2 = bounds
             width = x2 - x1
             height = y2 - y1
-            
+
             # Ignorer les layers trop petits
             if width < MIN_LAYER_SIZE or height < MIN_LAYER_SIZE:
                 continue
-            
-            layer_info = {
-                'name': pdb.gimp_item_get_name(layer),
-                'x1': x1,
-                'y1': y1,
-                'x2': x2,
-                'y2': y2,
-                'center_x': (x1 + x2) / 2.0,
-                'center_y': (y1 + y2) / 2.0,
-                'width': width,
-                'height': height
-            }
-            layer_bounds.append(layer_info)
-        
+
+            layer_bounds.append(LayerBounds(
+                x1, y1, x2, y2,
+                (x1 + x2) / 2.0,
+                (y1 + y2) / 2.0,
+                width, height,
+                pdb.gimp_item_get_name(layer)
+            ))
+
+        if reused_records is not None:
+            layer_bounds.extend(reused_records)
+
+        _GROUP_SCAN_CACHE[board_content_group.ID] = (
+            len(children),
+            children[0].ID if children else None,
+            list(layer_bounds)
+        )
+
         cache_build_time = time.time() - cache_start_time
         write_log("Layer bounds cache built: {0} layers in {1:.3f}s".format(
             len(layer_bounds), cache_build_time))
-        
+
         return layer_bounds
         
     except Exception as e:
@@ -651,7 +1082,88 @@ def build_layer_bounds_cache(img):
         write_log("Traceback: {0}".format(traceback.format_exc()))
         return []
 
-def check_cell_occupancy_optimized(cell, cell_type, layer_bounds):
+def add_layer_to_cache(layer_bounds, layer):
+    """Ajouter un layer fraîchement placé au cache de bounds.
+
+    Complément incrémental de build_layer_bounds_cache : après chaque
+    placement, une insertion O(1) remplace la reconstruction O(L) du
+    cache complet (coût total de l'import : O(N+L) au lieu de O(N×L)).
+
+    La géométrie n'est PAS lue ici : l'entrée est insérée en mode différé
+    (référence au layer seulement) et les trois appels PDB de
+    get_layer_actual_bounds ne partent qu'au prochain scan qui en a
+    réellement besoin, via _resolve_deferred_bounds(). Le dernier layer
+    placé d'un import n'est ainsi jamais re-interrogé.
+
+    Args:
+        layer_bounds (list): Cache retourné par build_layer_bounds_cache
+        layer: Layer GIMP qui vient d'être inséré dans Board Content
+
+    Returns:
+        bool: True si le layer a été mis en attente dans le cache,
+            False en cas d'erreur — l'appelant doit alors reconstruire
+            le cache complet.
+    """
+    try:
+        # L'objet layer lui-même sert de sentinelle "différé" : tout ce
+        # qui n'est pas un tuple sera matérialisé par le resolver
+        layer_bounds.append(layer)
+        return True
+    except Exception as e:
+        write_log("ERROR adding layer to bounds cache: {0}".format(e))
+        return False
+
+def _resolve_deferred_bounds(layer_bounds):
+    """Matérialiser les entrées différées du cache avant un scan.
+
+    Lit la géométrie des layers ajoutés par add_layer_to_cache et les
+    remplace par des tuples complets (même forme et mêmes filtres que
+    build_layer_bounds_cache). Les entrées illisibles ou trop petites
+    sont retirées avec un log plutôt que de faire échouer le scan.
+    """
+    removals = None
+    for idx, entry in enumerate(layer_bounds):
+        if isinstance(entry, tuple):
+            # Déjà un LayerBounds matérialisé
+            continue
+
+        layer = entry
+        bounds = get_layer_actual_bounds(layer)
+        if bounds is None:
+            write_log("Dropping unreadable deferred layer from cache")
+            if removals is None:
+                removals = []
+            removals.append(idx)
+            continue
+
+        x1, y1, x2, y2 = bounds
+        width = x2 - x1
+        height = y2 - y1
+
+        # Mêmes filtres que la construction complète
+        if width < MIN_LAYER_SIZE or height < MIN_LAYER_SIZE:
+            if removals is None:
+                removals = []
+            removals.append(idx)
+            continue
+
+        layer_bounds[idx] = LayerBounds(
+            x1, y1, x2, y2,
+            (x1 + x2) / 2.0,
+            (y1 + y2) / 2.0,
+            width, height,
+            layer.name
+        )
+
+    if removals:
+        for idx in reversed(removals):
+            del layer_bounds[idx]
+
+def check_cell_occupancy_optimized(cell, cell_type, layer_bounds,
+                                   _WIDE=WIDE_IMAGE_THRESHOLD,
+                                   _VWIDE=VERY_WIDE_IMAGE_THRESHOLD,
+                                   _CTOL=CENTER_TOLERANCE_RATIO,
+                                   _MIN=MIN_LAYER_SIZE):
     """Vérifier si une cellule est occupée EN UTILISANT LE CACHE.
     
     Cette fonction REMPLACE check_cell_occupancy() originale.
@@ -661,7 +1173,10 @@ def check_cell_occupancy_optimized(cell, cell_type, layer_bounds):
         cell (dict): Cellule avec clés minX, maxX, minY, maxY, index
         cell_type (str): "single" ou "spread"
         layer_bounds (list): Cache pré-calculé des bounds
-        
+        _WIDE, _VWIDE, _CTOL, _MIN: Ne pas fournir — liaisons des
+            constantes de module en arguments par défaut, lues en
+            LOAD_FAST dans la boucle au lieu de LOAD_GLOBAL
+
     Returns:
         tuple: (left_empty, right_empty) - bool pour chaque côté
         
@@ -678,80 +1193,77 @@ def check_cell_occupancy_optimized(cell, cell_type, layer_bounds):
         Gain : 10-50x par vérification
     """
     try:
-        write_log("Checking occupancy for cell {0} (cached)".format(
-            cell.get('index', '?')))
-        
-        cell_left = int(cell['minX'])
-        cell_top = int(cell['minY'])
-        cell_right = int(cell['maxX'])
-        cell_bottom = int(cell['maxY'])
+        write_log("Checking occupancy for cell {0} (cached)", None,
+                  cell.get('index', '?'))
+        
+        # Coordonnées déjà entières depuis la construction des cellules
+        # (read_dit_file / extend_board) : pas de re-cast int() ici
+        cell_left = cell['minX']
+        cell_top = cell['minY']
+        cell_right = cell['maxX']
+        cell_bottom = cell['maxY']
         cell_width = cell_right - cell_left
         cell_height = cell_bottom - cell_top
         
         if cell_type.lower() == "single":
             # Mode single : vérifier si le centre d'un layer est dans la cellule
-            for layer_info in layer_bounds:
-                center_x = layer_info['center_x']
-                center_y = layer_info['center_y']
-                
+            # (tuples plats : un déballage par layer, zéro lookup de dict)
+            for x1, y1, x2, y2, center_x, center_y, width, height, name \
+                    in layer_bounds:
                 if (center_x >= cell_left and center_x < cell_right and
                     center_y >= cell_top and center_y < cell_bottom):
-                    write_log("Single cell occupied by: {0}".format(
-                        layer_info['name']))
+                    write_log("Single cell occupied by: {0}", None, name)
                     return (False, False)
             
             return (True, True)
         
         elif cell_type.lower() == "spread":
-            # Mode spread : logique complexe avec zones left/right
+            # Mode spread : logique complexe avec zones left/right.
+            # Les zones sont de simples scalaires : la frontière verticale
+            # zone_split suffit, les Y sont ceux de la cellule (aucune
+            # allocation de dict par appel)
             half_width = cell_width // 2
             cell_center_x = cell_left + half_width
-            
-            # Définir les zones
-            left_zone = {
-                'minX': cell_left,
-                'minY': cell_top,
-                'maxX': cell_left + half_width,
-                'maxY': cell_bottom
-            }
-            right_zone = {
-                'minX': cell_left + half_width,
-                'minY': cell_top,
-                'maxX': cell_right,
-                'maxY': cell_bottom
-            }
-            
+            zone_split = cell_left + half_width
+
             left_occupied = False
             right_occupied = False
-            
-            for layer_info in layer_bounds:
-                x1, y1, x2, y2 = layer_info['x1'], layer_info['y1'], \
-                                 layer_info['x2'], layer_info['y2']
-                center_x = layer_info['center_x']
-                center_y = layer_info['center_y']
-                width = layer_info['width']
-                height = layer_info['height']
-                
+
+            # Invariants de boucle liés en locaux : bornes élargies du
+            # filtre coarse, inverse de la largeur (une multiplication
+            # remplace la division flottante par layer) ; les seuils sont
+            # déjà des locaux via les arguments par défaut
+            near_left = cell_left - _MIN
+            near_right = cell_right + _MIN
+            near_top = cell_top - _MIN
+            near_bottom = cell_bottom + _MIN
+            inv_cell_width = 1.0 / cell_width
+            wide_t = _WIDE
+            vwide_t = _VWIDE
+            center_tolerance = cell_width * _CTOL
+            cell_center_x_calc = cell_left + (cell_width / 2.0)
+
+            for x1, y1, x2, y2, center_x, center_y, width, height, name \
+                    in layer_bounds:
                 # Ignorer si hors de la cellule
-                if (center_x < cell_left - MIN_LAYER_SIZE or 
-                    center_x > cell_right + MIN_LAYER_SIZE or
-                    center_y < cell_top - MIN_LAYER_SIZE or 
-                    center_y > cell_bottom + MIN_LAYER_SIZE):
+                if (center_x < near_left or center_x > near_right or
+                    center_y < near_top or center_y > near_bottom):
                     continue
-                
-                width_ratio = float(width) / float(cell_width)
-                
+
+                width_ratio = width * inv_cell_width
+
                 # Image large
-                if width_ratio > WIDE_IMAGE_THRESHOLD:
-                    # Vérifier intersection avec zones
-                    left_intersects = not (x2 <= left_zone['minX'] or 
-                                          x1 >= left_zone['maxX'] or 
-                                          y2 <= left_zone['minY'] or 
-                                          y1 >= left_zone['maxY'])
-                    right_intersects = not (x2 <= right_zone['minX'] or 
-                                           x1 >= right_zone['maxX'] or 
-                                           y2 <= right_zone['minY'] or 
-                                           y1 >= right_zone['maxY'])
+                if width_ratio > wide_t:
+                    # Vérifier intersection avec zones (forme conjonctive :
+                    # pas de UNARY_NOT et court-circuit au premier axe séparant)
+                    left_intersects = (x2 > cell_left and
+                                       x1 < zone_split and
+                                       y2 > cell_top and
+                                       y1 < cell_bottom)
+                    right_intersects = (x2 > zone_split and
+                                        x1 < cell_right and
+                                        y2 > cell_top and
+                                        y1 < cell_bottom)
                     
                     if left_intersects:
                         left_occupied = True
@@ -759,16 +1271,15 @@ def check_cell_occupancy_optimized(cell, cell_type, layer_bounds):
                         right_occupied = True
                     
                     # Très large : occupe les deux côtés
-                    if width_ratio > VERY_WIDE_IMAGE_THRESHOLD:
+                    if width_ratio > vwide_t:
                         left_occupied = True
                         right_occupied = True
-                    
-                    # Centrée : occupe les deux côtés
-                    image_center_x = (x1 + x2) / 2.0
-                    cell_center_x_calc = cell_left + (cell_width / 2.0)
-                    center_distance = abs(image_center_x - cell_center_x_calc)
-                    
-                    if center_distance < (cell_width * CENTER_TOLERANCE_RATIO) and \
+
+                    # Centrée : occupe les deux côtés (center_x du cache
+                    # vaut déjà (x1+x2)/2, inutile de le recalculer)
+                    center_distance = abs(center_x - cell_center_x_calc)
+
+                    if center_distance < center_tolerance and \
                        width_ratio > 0.7:
                         left_occupied = True
                         right_occupied = True
@@ -776,12 +1287,10 @@ def check_cell_occupancy_optimized(cell, cell_type, layer_bounds):
                     # Image étroite : utiliser le centre
                     if not left_occupied and center_x < cell_center_x:
                         left_occupied = True
-                        write_log("Left side occupied by: {0}".format(
-                            layer_info['name']))
+                        write_log("Left side occupied by: {0}", None, name)
                     if not right_occupied and center_x >= cell_center_x:
                         right_occupied = True
-                        write_log("Right side occupied by: {0}".format(
-                            layer_info['name']))
+                        write_log("Right side occupied by: {0}", None, name)
                 
                 if left_occupied and right_occupied:
                     break
@@ -796,6 +1305,154 @@ def check_cell_occupancy_optimized(cell, cell_type, layer_bounds):
         write_log("Traceback: {0}".format(traceback.format_exc()))
         return (True, True)
 
+def _cell_geometry(cell):
+    """Géométrie dérivée d'une cellule, calculée une fois par cellule.
+
+    Les scans répétés de find_empty_cell_cached re-castaient int(minX/…)
+    et re-multipliaient les seuils à chaque appel alors que la liste de
+    cellules ne change pas pendant un import. Le tuple dérivé est
+    mémorisé dans le dict de la cellule (clé '_geom') — l'analogue
+    pur-Python des tableaux pré-calculés attachés au conteneur.
+
+    Returns:
+        tuple: (left, top, right, bottom, width, half_width, center_x,
+                wide_limit, vwide_limit, centered_width_limit,
+                center_tolerance, center_x_f)
+    """
+    geom = cell.get('_geom')
+    if geom is None:
+        left = int(cell['minX'])
+        top = int(cell['minY'])
+        right = int(cell['maxX'])
+        bottom = int(cell['maxY'])
+        width = right - left
+        half_width = width // 2
+        geom = (left, top, right, bottom, width, half_width,
+                left + half_width,
+                WIDE_IMAGE_THRESHOLD * width,
+                VERY_WIDE_IMAGE_THRESHOLD * width,
+                0.7 * width,
+                width * CENTER_TOLERANCE_RATIO,
+                left + (width / 2.0))
+        cell['_geom'] = geom
+    return geom
+
+def _find_empty_single(cells, sorted_bounds, centers_x):
+    """Spécialisation single de find_empty_cell_cached.
+
+    Cellule libre si aucun centre de layer dedans ; la fenêtre bisect
+    sur centers_x borne les candidats, il ne reste que le test Y.
+    """
+    for cell in cells:
+        geom = _cell_geometry(cell)
+        cell_top = geom[1]
+        cell_bottom = geom[3]
+
+        occupied = False
+        lo = bisect_left(centers_x, geom[0])
+        hi = bisect_left(centers_x, geom[2])
+        for x1, y1, x2, y2, center_x, center_y, width, height, \
+                name in sorted_bounds[lo:hi]:
+            if center_y >= cell_top and center_y < cell_bottom:
+                occupied = True
+                break
+
+        if not occupied:
+            write_log("Single cell {0} available", None, cell['index'])
+            return (cell, "left")
+
+    return (None, None)
+
+def _find_empty_spread(cells, sorted_bounds, centers_x, is_landscape,
+                       _MIN=MIN_LAYER_SIZE):
+    """Spécialisation spread de find_empty_cell_cached.
+
+    Zones left/right, même logique d'occupation que
+    check_cell_occupancy_optimized ; le choix du côté dépend de
+    l'orientation (Landscape exige les deux côtés libres).
+    """
+    for cell in cells:
+        # Géométrie et seuils pré-multipliés mémorisés par cellule :
+        # un seul lookup remplace les casts et produits par appel
+        (cell_left, cell_top, cell_right, cell_bottom, cell_width,
+         half_width, cell_center_x, wide_limit, vwide_limit,
+         centered_width_limit, center_tolerance,
+         cell_center_x_f) = _cell_geometry(cell)
+
+        # Zones en scalaires : seule la frontière verticale zone_split
+        # distingue left/right, les Y sont ceux de la cellule
+        zone_split = cell_left + half_width
+
+        left_occupied = False
+        right_occupied = False
+
+        # Fenêtre de candidats sur l'axe X via bisect ; le filtre
+        # coarse ne garde plus que la composante Y
+        lo = bisect_left(centers_x, cell_left - _MIN)
+        hi = bisect_right(centers_x, cell_right + _MIN)
+        for x1, y1, x2, y2, center_x, center_y, width, height, \
+                name in sorted_bounds[lo:hi]:
+            # Ignorer si hors de la cellule (axe Y)
+            if (center_y < cell_top - _MIN or
+                center_y > cell_bottom + _MIN):
+                continue
+
+            # Image large — accumulation par |= plutôt que par
+            # cascade de if : les prédicats se combinent sans
+            # branchement intermédiaire
+            if width > wide_limit:
+                # Forme conjonctive du test de recouvrement : pas
+                # de UNARY_NOT, court-circuit au premier axe séparant
+                left_occupied |= (x2 > cell_left and
+                                  x1 < zone_split and
+                                  y2 > cell_top and
+                                  y1 < cell_bottom)
+                right_occupied |= (x2 > zone_split and
+                                   x1 < cell_right and
+                                   y2 > cell_top and
+                                   y1 < cell_bottom)
+
+                # Très large ou centrée : occupe les deux côtés
+                # (center_x du cache vaut déjà (x1+x2)/2, et le
+                # centre de cellule est invariant de la boucle)
+                both = (width > vwide_limit or
+                        (abs(center_x - cell_center_x_f) <
+                         center_tolerance and
+                         width > centered_width_limit))
+                left_occupied |= both
+                right_occupied |= both
+            else:
+                # Image étroite : utiliser le centre
+                left_occupied |= center_x < cell_center_x
+                right_occupied |= center_x >= cell_center_x
+
+            if left_occupied and right_occupied:
+                break
+
+        if is_landscape:
+            if not left_occupied and not right_occupied:
+                write_log("Spread cell {0} available for landscape",
+                          None, cell['index'])
+                return (cell, "left")
+        else:  # Portrait
+            if not left_occupied:
+                write_log("Spread cell {0} available (left)", None,
+                          cell['index'])
+                return (cell, "left")
+            elif not right_occupied:
+                write_log("Spread cell {0} available (right)", None,
+                          cell['index'])
+                return (cell, "right")
+
+    return (None, None)
+
+# Index spatial mémoïsé entre deux scans : [liste source, longueur,
+# cache trié par center_x, centres]. La référence forte sur la liste
+# garantit qu'un même couple (objet, longueur) désigne le même contenu —
+# toute mutation du cache passe par append ou suppression, donc change
+# la longueur avant le scan suivant.
+_SCAN_INDEX_CACHE = [None, -1, None, None]
+
 def find_empty_cell_cached(cells, cell_type, orientation, layer_bounds_cache):
     """Trouver une cellule vide EN UTILISANT LE CACHE.
     
@@ -821,41 +1478,64 @@ def find_empty_cell_cached(cells, cell_type, orientation, layer_bounds_cache):
         - Avec cache : O(M) car L est pré-calculé
         - Pour 50 cellules, 30 layers : 1500 appels → 50 appels
         - Gain : ~30x
+
+    Note:
+        Simple répartiteur : le test d'occupation vit dans les
+        spécialisations _find_empty_single / _find_empty_spread, choisies
+        une fois par appel (et non par cellule) après résolution du
+        cell_type et de l'orientation. Chaque spécialisation est une
+        boucle fusionnée cellules×layers avec sortie anticipée dès la
+        première cellule utilisable ; check_cell_occupancy_optimized
+        reste l'API publique pour tester une cellule isolée.
     """
     try:
         write_log("====== Finding empty cell (CACHED) ======")
-        write_log("Cell type: {0}, Orientation: {1}".format(
-            cell_type, orientation))
-        
-        for i in range(len(cells)):
-            cell = cells[i]
-            left_empty, right_empty = check_cell_occupancy_optimized(
-                cell, cell_type, layer_bounds_cache)
-            
-            if cell_type.lower() == "single":
-                if left_empty:
-                    write_log("Single cell {0} available".format(cell['index']))
-                    return (cell, "left")
-            
-            elif cell_type.lower() == "spread":
-                if orientation == "Landscape":
-                    if left_empty and right_empty:
-                        write_log("Spread cell {0} available for landscape".format(
-                            cell['index']))
-                        return (cell, "left")
-                else:  # Portrait
-                    if left_empty:
-                        write_log("Spread cell {0} available (left)".format(
-                            cell['index']))
-                        return (cell, "left")
-                    elif right_empty:
-                        write_log("Spread cell {0} available (right)".format(
-                            cell['index']))
-                        return (cell, "right")
-        
-        write_log("No empty cell found")
-        return (None, None)
-        
+        write_log("Cell type: {0}, Orientation: {1}", None,
+                  cell_type, orientation)
+
+        # Lecture paresseuse : les layers placés depuis le dernier scan
+        # n'ont pas encore de bounds, on les interroge seulement maintenant
+        _resolve_deferred_bounds(layer_bounds_cache)
+
+        # Court-circuit global : board vierge (ou cache vide après filtres)
+        # → la première cellule est forcément libre, aucun scan à faire
+        if not layer_bounds_cache:
+            if cells:
+                write_log("Empty cache, first cell {0} trivially available",
+                          None, cells[0]['index'])
+                return (cells[0], "left")
+            return (None, None)
+
+        # Index spatial léger : cache trié par center_x + liste parallèle
+        # des centres. Pour chaque cellule, une paire de bisect délimite la
+        # fenêtre des layers candidats — les layers loin de la cellule ne
+        # sont plus visités du tout (L tests/cellule → O(candidats)).
+        # L'index est mémoïsé tant que le cache n'a pas changé : les scans
+        # répétés sur le même état (ex. re-scan après extension) ne
+        # re-trient pas.
+        if _SCAN_INDEX_CACHE[0] is layer_bounds_cache and \
+           _SCAN_INDEX_CACHE[1] == len(layer_bounds_cache):
+            sorted_bounds = _SCAN_INDEX_CACHE[2]
+            centers_x = _SCAN_INDEX_CACHE[3]
+        else:
+            sorted_bounds = sorted(layer_bounds_cache, key=itemgetter(4))
+            centers_x = [rec[4] for rec in sorted_bounds]
+            _SCAN_INDEX_CACHE[0] = layer_bounds_cache
+            _SCAN_INDEX_CACHE[1] = len(layer_bounds_cache)
+            _SCAN_INDEX_CACHE[2] = sorted_bounds
+            _SCAN_INDEX_CACHE[3] = centers_x
+
+        # Dispatch résolu une seule fois par appel
+        if cell_type.lower() == "single":
+            result = _find_empty_single(cells, sorted_bounds, centers_x)
+        else:
+            result = _find_empty_spread(cells, sorted_bounds, centers_x,
+                                        orientation == "Landscape")
+
+        if result[0] is None:
+            write_log("No empty cell found")
+        return result
+
     except Exception as e:
         write_log("ERROR in find_empty_cell_cached: {0}".format(e))
         return (None, None)
@@ -868,7 +1548,7 @@ __version__ = "2.0"
 __author__ = "Yan Senez"
 __all__ = [
     # Logging
-    'write_log',
+    'write_log', 'write_log_debug',
     # Type conversion
     'safe_float', 'safe_int',
     # Color conversion
@@ -876,15 +1556,18 @@ __all__ = [
     # File operations
     'sanitize_filename', 'find_overlay_files',
     # Image operations
-    'get_image_orientation', 'create_guide',
+    'get_image_size', 'get_image_orientation',
+    'prefetch_image_orientations', 'flush_temp_image_pool',
+    'create_guide',
     # Overlay operations
     'calculate_overlay_dimensions', 'place_overlay_in_cell',
     'get_overlay_index_for_cell',
     # Performance - Cache
     'get_layer_actual_bounds', 'build_layer_bounds_cache',
+    'add_layer_to_cache', 'reset_group_scan_cache',
     'check_cell_occupancy_optimized', 'find_empty_cell_cached',
     # Constants
-    'ENABLE_LOGS', 'IMAGE_EXTENSIONS', 'DEFAULT_DPI',
+    'ENABLE_LOGS', 'LOG_LEVEL', 'IMAGE_EXTENSIONS', 'DEFAULT_DPI',
     'POSITION_TOLERANCE', 'MIN_LAYER_SIZE',
     'CENTER_TOLERANCE_RATIO', 'WIDE_IMAGE_THRESHOLD',
     'VERY_WIDE_IMAGE_THRESHOLD'